@@ -0,0 +1,31 @@
+"""add composite lookup index to intelligence content
+
+Revision ID: add_intelligence_content_lookup_index
+Revises: e159ce96208a
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_intelligence_content_lookup_index'
+down_revision = 'e159ce96208a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Category lookups filter on category/is_active/is_deprecated and order by
+    # priority then recency; one composite index covers both
+    op.create_index(
+        'idx_intelligence_content_lookup',
+        'intelligence_content',
+        ['category', 'is_active', 'is_deprecated', 'display_priority', 'created_at'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('idx_intelligence_content_lookup', table_name='intelligence_content')
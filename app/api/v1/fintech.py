@@ -20,7 +20,12 @@ from app.schemas.fintech import (
     ExchangeRiskRequest, ExchangeRiskResponse
 )
 from app.services.fintech_scenarios import FintechScenarioCatalog
-from app.services.fintech_ml_service import fintech_ml_service
+from app.services.fintech_ml_service import (
+    fintech_ml_service,
+    CREDIT_BAND_SCORE_MAP,
+    CHANNEL_RISK_SCORE_MAP,
+    OCCUPATION_RISK_SCORE_MAP
+)
 from app.services.fintech_explanation_engine import fintech_explanation_engine
 from app.services.fintech_data_generator import FintechDataGenerator
 from app.services.market_intelligence_ml_service import market_intelligence_ml_service
@@ -90,7 +95,7 @@ async def credit_risk_assessment(
             borrower_profile["annual_income"] / 200000.0,
             borrower_profile["income_volatility_index"],
             borrower_profile["residence_stability_score"],
-            {"excellent": 0.9, "good": 0.7, "fair": 0.5, "poor": 0.3}.get(credit_history["credit_score_band"], 0.5),
+            CREDIT_BAND_SCORE_MAP.get(credit_history["credit_score_band"], 0.5),
             credit_history["total_active_loans"] / 10.0,
             credit_history["delinquency_count"] / 12.0,
             credit_history["repayment_consistency_score"],
@@ -210,7 +215,7 @@ async def fraud_detection(
         # Prepare features for ML model
         features = [
             amount / 10000.0,
-            {"online": 0.3, "pos": 0.4, "atm": 0.1, "mobile": 0.2}.get(channel_type, 0.3),
+            CHANNEL_RISK_SCORE_MAP.get(channel_type, 0.3),
             1.0 if geo_deviation else 0.0,
             hour / 24.0,
             account_profile["account_age_days"] / 3650.0,
@@ -324,7 +329,7 @@ async def kyc_aml_assessment(
         # Prepare features for ML model
         features = [
             1.0 if customer_identity["country_code"] in low_risk_countries else 0.0,
-            {"low": 0.2, "medium": 0.5, "high": 0.8}.get(customer_identity["occupation_risk_level"], 0.5),
+            OCCUPATION_RISK_SCORE_MAP.get(customer_identity["occupation_risk_level"], 0.5),
             identity_verification["document_match_score"],
             identity_verification["biometric_match_score"],
             identity_verification["name_similarity_score"],
@@ -2,7 +2,7 @@
 Healthcare API Routes - Comprehensive Use Case Wrapper
 Includes theory, stats, inputs, outputs, AI pipeline processing, and data mappings
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Form
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Form, Request, Response
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, field_validator
 from app.schemas.common import StandardResponse
@@ -1024,9 +1024,20 @@ async def resource_allocation(
     )
 
 
+def _static_json_response(request: Request, payload: bytes, etag: str) -> Response:
+    """Serve a pre-serialized payload, answering conditional GETs with 304"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in candidates or etag in candidates or f"W/{etag}" in candidates:
+            return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
 # New endpoint to get all healthcare use cases with metadata
 @router.get("/use-cases", response_model=HealthcareUseCasesListResponse)
 async def get_all_use_cases(
+    request: Request,
     include_inactive: bool = Query(False, description="Include inactive use cases")
 ):
     """
@@ -1036,17 +1047,12 @@ async def get_all_use_cases(
     - List of all healthcare use cases
     - Each use case includes theory, stats, inputs, outputs, pipeline, and data mappings
     """
-    all_use_cases = HealthcareMetadataService.get_all_use_cases()
-    
-    if not include_inactive:
-        # Filter active use cases (all are active by default in metadata)
-        all_use_cases = [uc for uc in all_use_cases if uc.is_dynamic or True]  # All are active
-    
-    return HealthcareUseCasesListResponse(
-        success=True,
-        industry="healthcare",
-        total_use_cases=len(all_use_cases),
-        use_cases=all_use_cases
+    # All use cases are active by default in metadata, so include_inactive
+    # does not change the listing; the static payload is serialized once
+    return _static_json_response(
+        request,
+        HealthcareMetadataService.get_all_use_cases_response_json(),
+        HealthcareMetadataService.get_all_use_cases_response_etag()
     )
 
 
@@ -1195,7 +1201,7 @@ async def get_risk_scoring_insights(request: RiskScoringRequest):
 
 
 @router.get("/use-cases/{use_case_id}", response_model=HealthcareUseCaseResponse)
-async def get_use_case_metadata(use_case_id: str):
+async def get_use_case_metadata(use_case_id: str, request: Request):
     """
     Get metadata for a specific healthcare use case
     
@@ -1207,18 +1213,14 @@ async def get_use_case_metadata(use_case_id: str):
     - Data mappings
     - Classifications
     """
-    metadata = HealthcareMetadataService.get_use_case_metadata(use_case_id)
-    if not metadata:
+    payload = HealthcareMetadataService.get_use_case_response_json(use_case_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Use case {use_case_id} not found")
     
-    return HealthcareUseCaseResponse(
-        success=True,
-        use_case_metadata=metadata,
-        execution_result={},
-        pipeline_execution=metadata.pipeline_steps,
-        classifications=[],
-        data_source_info={},
-        recommendations=metadata.tips
+    return _static_json_response(
+        request,
+        payload,
+        HealthcareMetadataService.get_use_case_response_etag(use_case_id)
     )
 
 
@@ -3,7 +3,7 @@ Intelligence Content Store Models
 Central intelligence layer that powers all industries, use cases, explanations, and conversations
 Replaces static text with DB-driven, dynamic intelligence content
 """
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Float, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Float, Boolean, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -32,6 +32,11 @@ class ConfidenceLevel(str, enum.Enum):
     UNCERTAIN = "uncertain"
 
 
+def _enum_values(enum_cls):
+    """Persist enum members by value: the Postgres enum types hold the lowercase values"""
+    return [member.value for member in enum_cls]
+
+
 class IntelligenceContent(Base):
     """
     Central Intelligence Content Store
@@ -43,7 +48,7 @@ class IntelligenceContent(Base):
     
     # Content identification
     content_key = Column(String(255), nullable=False, index=True)  # Unique identifier (e.g., "fintech.credit_risk.decision_explanation.high_risk")
-    category = Column(Enum(ContentCategory), nullable=False, index=True)
+    category = Column(Enum(ContentCategory, name="contentcategory", values_callable=_enum_values), nullable=False, index=True)
     
     # Context for content retrieval
     industry_id = Column(String(100), nullable=True, index=True)  # Optional: specific industry
@@ -56,7 +61,7 @@ class IntelligenceContent(Base):
     structured_data = Column(JSON)  # For structured content (e.g., workflow steps, comparison data)
     
     # Intelligence metadata
-    confidence_level = Column(Enum(ConfidenceLevel), nullable=True, index=True)
+    confidence_level = Column(Enum(ConfidenceLevel, name="confidencelevel", values_callable=_enum_values), nullable=True, index=True)
     data_freshness_days = Column(Integer, nullable=True)  # How fresh the underlying data is
     model_agreement_score = Column(Float, nullable=True)  # Agreement between multiple models (0.0-1.0)
     
@@ -86,6 +91,12 @@ class IntelligenceContent(Base):
     # Embedding for semantic search (optional, for future AI-powered retrieval)
     embedding = Column(JSON)
     embedding_model = Column(String(100))
+    
+    __table_args__ = (
+        # Serves the category lookups in IntelligenceService: equality on
+        # category/is_active/is_deprecated, then priority/recency ordering
+        Index('idx_intelligence_content_lookup', 'category', 'is_active', 'is_deprecated', 'display_priority', 'created_at'),
+    )
 
 
 class IntelligenceConversation(Base):
@@ -93,6 +104,8 @@ class IntelligenceConversation(Base):
     Stores conversation fragments for contextual navigation (Category 6)
     """
     __tablename__ = "intelligence_conversations"
+    # Fetch created_at with the INSERT (RETURNING on Postgres) rather than on first access
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, index=True)
     
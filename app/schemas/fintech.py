@@ -10,12 +10,17 @@ from enum import Enum
 
 # ==================== EXPLANATION CONTRACT (MANDATORY) ====================
 # Decision Walkthrough Tab Structure - 7 Sections
+# Explanation models are frozen: they are built once per decision and the
+# engines share pre-built instances across responses.
 
 class InfluencingFactor(BaseModel):
     """Top influencing factor for Decision Walkthrough"""
     factor_name: str = Field(..., description="Name of the factor")
     influence_direction: str = Field(..., description="'increase' or 'decrease'")
     short_reason: str = Field(..., description="Brief explanation of why this factor matters")
+    
+    class Config:
+        frozen = True
 
 
 class ConfidenceAssessment(BaseModel):
@@ -23,12 +28,18 @@ class ConfidenceAssessment(BaseModel):
     confidence_level: str = Field(..., description="'low', 'medium', or 'high'")
     confidence_reason: str = Field(..., description="Why confidence is at this level")
     known_limitations: str = Field(..., description="What limits confidence in this decision")
+    
+    class Config:
+        frozen = True
 
 
 class HumanReviewGuidance(BaseModel):
     """Human review guidance for Decision Walkthrough"""
     review_recommended: bool = Field(..., description="Whether human review is recommended")
     review_reason: str = Field(..., description="Why review is or isn't recommended")
+    
+    class Config:
+        frozen = True
 
 
 class ContributingFactor(BaseModel):
@@ -37,6 +48,9 @@ class ContributingFactor(BaseModel):
     impact_score: float = Field(..., ge=0.0, le=1.0)
     direction: str = Field(..., description="'increases' or 'decreases' risk/score")
     explanation: str
+    
+    class Config:
+        frozen = True
 
 
 class SensitivityAnalysis(BaseModel):
@@ -45,6 +59,9 @@ class SensitivityAnalysis(BaseModel):
     baseline_value: Any
     sensitivity_range: Dict[str, Any]
     impact_description: str
+    
+    class Config:
+        frozen = True
 
 
 class ScenarioImpact(BaseModel):
@@ -53,6 +70,9 @@ class ScenarioImpact(BaseModel):
     scenario_adjustment: Dict[str, Any]
     decision_change: str
     confidence_impact: float
+    
+    class Config:
+        frozen = True
 
 
 class ExplanationObject(BaseModel):
@@ -92,6 +112,9 @@ class ExplanationObject(BaseModel):
     human_review_recommended: bool = Field(..., description="Whether human review is recommended")
     model_version: str = Field(..., description="Model version used for inference")
     inference_timestamp: datetime = Field(default_factory=datetime.now)
+    
+    class Config:
+        frozen = True
 
 
 # ==================== MODULE 1: CREDIT RISK ====================
@@ -2,7 +2,7 @@
 Healthcare-specific schemas for use case metadata
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, Tuple
 from enum import Enum
 
 
@@ -14,6 +14,9 @@ class DataSourceType(str, Enum):
     MOCK = "mock"
 
 
+# Use case metadata models are frozen: the metadata service builds each
+# use case once and shares the instances across requests.
+
 class PipelineStep(BaseModel):
     """AI pipeline processing step"""
     step_id: str
@@ -25,6 +28,9 @@ class PipelineStep(BaseModel):
     processing_time_ms: Optional[float] = None
     confidence: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    class Config:
+        frozen = True
 
 
 class Classification(BaseModel):
@@ -33,6 +39,9 @@ class Classification(BaseModel):
     label: str
     confidence: float
     explanation: Optional[str] = None
+    
+    class Config:
+        frozen = True
 
 
 class DataMapping(BaseModel):
@@ -44,6 +53,9 @@ class DataMapping(BaseModel):
     example_value: Any
     required: bool = True
     validation_rules: Optional[List[str]] = None
+    
+    class Config:
+        frozen = True
 
 
 class UseCaseTheory(BaseModel):
@@ -51,11 +63,14 @@ class UseCaseTheory(BaseModel):
     overview: str
     problem_statement: str
     solution_approach: str
-    ai_techniques: List[str]
-    benefits: List[str]
-    limitations: List[str]
-    best_practices: List[str]
-    references: Optional[List[str]] = None
+    ai_techniques: Tuple[str, ...]
+    benefits: Tuple[str, ...]
+    limitations: Tuple[str, ...]
+    best_practices: Tuple[str, ...]
+    references: Optional[Tuple[str, ...]] = None
+    
+    class Config:
+        frozen = True
 
 
 class UseCaseStats(BaseModel):
@@ -65,7 +80,10 @@ class UseCaseStats(BaseModel):
     average_confidence: float = 0.0
     average_latency_ms: float = 0.0
     data_points_processed: int = 0
-    model_versions_used: List[str] = []
+    model_versions_used: Tuple[str, ...] = ()
+    
+    class Config:
+        frozen = True
 
 
 class InputSchema(BaseModel):
@@ -74,6 +92,9 @@ class InputSchema(BaseModel):
     fields: List[DataMapping]
     example: Dict[str, Any]
     validation_schema: Optional[Dict[str, Any]] = None
+    
+    class Config:
+        frozen = True
 
 
 class OutputSchema(BaseModel):
@@ -82,6 +103,9 @@ class OutputSchema(BaseModel):
     fields: List[DataMapping]
     example: Dict[str, Any]
     classifications: Optional[List[Classification]] = None
+    
+    class Config:
+        frozen = True
 
 
 class UseCaseMetadata(BaseModel):
@@ -95,13 +119,16 @@ class UseCaseMetadata(BaseModel):
     stats: UseCaseStats
     input_schema: InputSchema
     output_schema: OutputSchema
-    pipeline_steps: List[PipelineStep]
+    pipeline_steps: Tuple[PipelineStep, ...]
     data_mapping: Dict[str, DataMapping]  # Field name -> mapping
     api_endpoint: str
     is_dynamic: bool = False
-    keywords: List[str] = []
-    tips: List[str] = []
+    keywords: Tuple[str, ...] = ()
+    tips: Tuple[str, ...] = ()
     icon: Optional[str] = None
+    
+    class Config:
+        frozen = True
 
 
 class HealthcareUseCaseResponse(BaseModel):
@@ -16,6 +16,16 @@ class FintechDataGenerator:
     Produces statistically realistic data with controlled correlations
     """
     
+    # Vocabularies for the batch generators, which return categorical
+    # columns as integer codes into these tuples
+    EMPLOYMENT_TYPES = ("full_time", "part_time", "self_employed", "unemployed")
+    CREDIT_SCORE_BANDS = ("excellent", "good", "fair", "poor")
+    TRANSACTION_CHANNELS = ("online", "pos", "atm", "mobile")
+    GEO_LOCATIONS = ("US", "CA", "UK", "DE", "FR", "BR", "MX", "IN")
+    COUNTRY_CODES = ("US", "CA", "UK", "DE", "FR", "AU", "NZ", "XX", "YY", "ZZ")
+    OCCUPATION_RISK_LEVELS = ("low", "medium", "high")
+    AML_RISK_LEVELS = ("low", "medium", "high", "very_high")
+    
     def __init__(self, seed: int = 42):
         """Initialize generator with seed for reproducibility"""
         np.random.seed(seed)
@@ -285,6 +295,7 @@ class FintechDataGenerator:
             "account_id": account_id,
             "amount": round(amount, 2),
             "timestamp": timestamp.isoformat(),
+            "hour": int(hour),
             "channel_type": channel_type,
             "merchant_category": np.random.choice(merchant_categories),
             "geo_location": geo_location
@@ -473,4 +484,235 @@ class FintechDataGenerator:
             })
         
         return series
-
+    
+    # ==================== BATCH GENERATION (TRAINING) ====================
+    # Columnar equivalents of the per-record generators above: same
+    # distributions and correlations, drawn for n records at once as numpy
+    # arrays so training sets are built without a per-row Python loop
+    
+    def generate_borrower_profile_batch(self, n: int) -> Dict[str, np.ndarray]:
+        """Generate n borrower profiles (see generate_borrower_profile)"""
+        age = np.clip(np.trunc(np.random.normal(42, 12, n)), 18, 80)
+        
+        # Codes into EMPLOYMENT_TYPES
+        employment_type = np.random.choice(4, size=n, p=[0.6, 0.15, 0.2, 0.05])
+        
+        income_mu = np.array([10.5, 9.8, 10.8, 9.0])[employment_type]
+        income_sigma = np.array([0.5, 0.4, 0.8, 0.3])[employment_type]
+        base_income = np.random.lognormal(income_mu, income_sigma)
+        age_factor = np.select(
+            [employment_type == 0, employment_type == 2, employment_type == 1],
+            [(age - 25) / 40, (age - 30) / 30, 0.5],
+            default=0.2
+        )
+        annual_income = np.maximum(10000, base_income * (1 + age_factor * 0.5))
+        
+        stability_base = np.array([0.7, 0.3, 0.5, 0.3])[employment_type]
+        employment_stability_score = np.clip(
+            np.random.beta(np.maximum(0.1, stability_base * 10), np.maximum(0.1, (1 - stability_base) * 10)),
+            0.0, 1.0
+        )
+        income_volatility_index = np.clip(1.0 - employment_stability_score + np.random.normal(0, 0.1, n), 0.0, 1.0)
+        residence_stability_score = np.clip(
+            np.random.beta(np.maximum(0.1, (age / 10) * 2), np.maximum(0.1, (1 - age / 80) * 2)),
+            0.0, 1.0
+        )
+        
+        return {
+            "age": age.astype(int),
+            "employment_type": employment_type,
+            "employment_stability_score": np.round(employment_stability_score, 3),
+            "annual_income": np.round(annual_income, 2),
+            "income_volatility_index": np.round(income_volatility_index, 3),
+            "residence_stability_score": np.round(residence_stability_score, 3)
+        }
+    
+    def generate_credit_history_batch(self, borrower_profiles: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Generate credit histories for a borrower batch (see generate_credit_history)"""
+        income = borrower_profiles["annual_income"]
+        n = len(income)
+        
+        income_factor = np.minimum(income / 100000, 1.0)
+        base_score = 300 + (income_factor * 0.4 + borrower_profiles["employment_stability_score"] * 0.3) * 550
+        credit_score = np.clip(np.random.normal(base_score, 50), 300, 850)
+        
+        # Codes into CREDIT_SCORE_BANDS: >=750 excellent ... <650 poor
+        credit_score_band = 3 - np.searchsorted([650, 700, 750], credit_score, side="right")
+        
+        total_active_loans = np.random.poisson(income / 50000)
+        delinquency_prob = np.maximum(0, (850 - credit_score) / 550)
+        delinquency_count = np.random.binomial(12, delinquency_prob * 0.1)
+        historical_default_flag = np.random.random(n) < delinquency_prob * 0.05
+        
+        repayment_consistency_score = np.clip(credit_score / 850, 0.0, 1.0) + np.random.normal(0, 0.1, n)
+        repayment_consistency_score = np.clip(repayment_consistency_score, 0.0, 1.0)
+        
+        return {
+            "credit_score_band": credit_score_band,
+            "total_active_loans": total_active_loans,
+            "delinquency_count": delinquency_count,
+            "historical_default_flag": historical_default_flag,
+            "repayment_consistency_score": np.round(repayment_consistency_score, 3)
+        }
+    
+    def generate_financial_behavior_batch(self, borrower_profiles: Dict[str, np.ndarray],
+                                          credit_history: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Generate financial behavior for a borrower batch (see generate_financial_behavior)"""
+        income = borrower_profiles["annual_income"]
+        band = credit_history["credit_score_band"]
+        n = len(income)
+        
+        avg_monthly_obligation = income / 12 * np.random.uniform(0.2, 0.5, n)
+        
+        dti_base = np.array([0.2, 0.2, 0.35, 0.5])[band]
+        debt_to_income_ratio = np.clip(np.random.normal(dti_base, 0.1), 0.0, 1.0)
+        
+        util_base = np.array([0.2, 0.2, 0.6, 0.6])[band]
+        utilization_ratio = np.clip(
+            np.random.beta(np.maximum(0.1, util_base * 10), np.maximum(0.1, (1 - util_base) * 10)),
+            0.0, 1.0
+        )
+        
+        delay_base = np.array([0.05, 0.1, 0.25, 0.5])[band]
+        payment_delay_frequency = np.clip(
+            np.random.beta(np.maximum(0.1, delay_base * 10), np.maximum(0.1, (1 - delay_base) * 10)),
+            0.0, 1.0
+        )
+        
+        return {
+            "avg_monthly_obligation": np.round(avg_monthly_obligation, 2),
+            "debt_to_income_ratio": np.round(debt_to_income_ratio, 3),
+            "utilization_ratio": np.round(utilization_ratio, 3),
+            "payment_delay_frequency": np.round(payment_delay_frequency, 3)
+        }
+    
+    def generate_credit_outcome_batch(self, credit_history: Dict[str, np.ndarray],
+                                      financial_behavior: Dict[str, np.ndarray],
+                                      economic_stress_level: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate 12-month default outcomes for a borrower batch (see generate_credit_outcome)"""
+        base_prob = np.array([0.01, 0.03, 0.08, 0.15])[credit_history["credit_score_band"]]
+        
+        behavior_multiplier = (
+            1.0
+            + (financial_behavior["debt_to_income_ratio"] - 0.3) * 2
+            + (financial_behavior["utilization_ratio"] - 0.4) * 1.5
+            + financial_behavior["payment_delay_frequency"] * 1.5
+        )
+        behavior_multiplier = np.clip(behavior_multiplier, 0.5, 3.0)
+        stress_multiplier = 1.0 + economic_stress_level * 2.0
+        
+        default_probability = np.minimum(0.5, base_prob * behavior_multiplier * stress_multiplier)
+        
+        return {
+            "default_within_12m": np.random.random(len(base_prob)) < default_probability
+        }
+    
+    def generate_account_profile_batch(self, n: int) -> Dict[str, np.ndarray]:
+        """Generate n account profiles (see generate_account_profile)"""
+        return {
+            "account_age_days": np.random.randint(30, 3650, n),
+            "avg_transaction_amount": np.round(np.random.lognormal(4.0, 0.6, n), 2),
+            # Codes into GEO_LOCATIONS; accounts are US-based
+            "typical_geo_region": np.zeros(n, dtype=int)
+        }
+    
+    def generate_transaction_event_batch(self, is_fraud: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate one transaction per is_fraud flag (see generate_transaction_event)"""
+        n = len(is_fraud)
+        
+        amount = np.where(
+            is_fraud,
+            np.random.lognormal(7, 1.5, n),
+            np.random.lognormal(4.5, 0.8, n)
+        )
+        # Codes into TRANSACTION_CHANNELS; fraud favors online/mobile
+        channel_type = np.where(
+            is_fraud,
+            np.random.choice(4, size=n, p=[0.4, 0.2, 0.1, 0.3]),
+            np.random.choice(4, size=n, p=[0.3, 0.4, 0.1, 0.2])
+        )
+        # Codes into GEO_LOCATIONS; legitimate activity stays in the US
+        geo_location = np.where(is_fraud, np.random.randint(0, len(self.GEO_LOCATIONS), n), 0)
+        # Fraud happens at unusual hours, legitimate activity in business hours
+        hour = np.where(
+            is_fraud,
+            np.random.choice([0, 1, 2, 3, 4, 5, 22, 23], size=n),
+            np.random.randint(9, 21, n)
+        ).astype(np.uint8)
+        
+        return {
+            "amount": np.round(amount, 2),
+            "channel_type": channel_type,
+            "geo_location": geo_location,
+            "hour": hour
+        }
+    
+    def generate_customer_identity_batch(self, is_high_risk: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate one customer identity per is_high_risk flag (see generate_customer_identity)"""
+        n = len(is_high_risk)
+        
+        # Codes into COUNTRY_CODES: 0-6 low-risk, 7-9 high-risk placeholders
+        country_code = np.where(is_high_risk, np.random.randint(7, 10, n), np.random.randint(0, 7, n))
+        # Codes into OCCUPATION_RISK_LEVELS
+        occupation_risk_level = np.where(
+            is_high_risk,
+            np.random.choice([1, 2], size=n, p=[0.3, 0.7]),
+            np.random.choice([0, 1], size=n, p=[0.8, 0.2])
+        )
+        
+        return {
+            "country_code": country_code,
+            "occupation_risk_level": occupation_risk_level
+        }
+    
+    def generate_identity_verification_batch(self, is_high_risk: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate identity verification signals per is_high_risk flag (see generate_identity_verification)"""
+        def scores(high_mean, high_std, low_mean, low_std):
+            return np.round(np.clip(np.where(
+                is_high_risk,
+                np.random.normal(high_mean, high_std, len(is_high_risk)),
+                np.random.normal(low_mean, low_std, len(is_high_risk))
+            ), 0.0, 1.0), 3)
+        
+        return {
+            "document_match_score": scores(0.7, 0.15, 0.95, 0.05),
+            "biometric_match_score": scores(0.75, 0.12, 0.97, 0.03),
+            "name_similarity_score": scores(0.65, 0.2, 0.92, 0.08)
+        }
+    
+    def generate_relationship_network_batch(self, is_high_risk: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate relationship networks per is_high_risk flag (see generate_relationship_network)"""
+        n = len(is_high_risk)
+        network_complexity_score = np.where(
+            is_high_risk,
+            np.random.normal(0.7, 0.15, n),
+            np.random.normal(0.3, 0.1, n)
+        )
+        
+        return {
+            "linked_entities_count": np.random.poisson(np.where(is_high_risk, 15, 3)),
+            "high_risk_link_flag": np.random.random(n) < np.where(is_high_risk, 0.6, 0.05),
+            "network_complexity_score": np.round(np.clip(network_complexity_score, 0.0, 1.0), 3)
+        }
+    
+    def generate_compliance_outcome_batch(self, customer_identity: Dict[str, np.ndarray],
+                                          relationship_network: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Generate compliance outcomes for a customer batch (see generate_compliance_outcome)"""
+        # US, CA and UK are the first three COUNTRY_CODES
+        country_risk = np.where(customer_identity["country_code"] < 3, 0.3, 0.7)
+        occupation_risk = np.array([0.2, 0.5, 0.8])[customer_identity["occupation_risk_level"]]
+        network_risk = np.where(relationship_network["high_risk_link_flag"], 0.3, 0.1)
+        network_risk = network_risk + relationship_network["network_complexity_score"] * 0.3
+        
+        aml_risk_score = country_risk * 0.4 + occupation_risk * 0.3 + network_risk * 0.3
+        
+        # Codes into AML_RISK_LEVELS: <0.3 low, <0.5 medium, <0.7 high, else very_high
+        aml_risk_level = np.searchsorted([0.3, 0.5, 0.7], aml_risk_score, side="right")
+        escalation_required = (aml_risk_level >= 2) | (
+            (aml_risk_level == 1) & (np.random.random(len(aml_risk_level)) < 0.3)
+        )
+        
+        return {
+            "escalation_required": escalation_required,
+            "aml_risk_level": aml_risk_level
+        }
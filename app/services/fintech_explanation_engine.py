@@ -2,12 +2,281 @@
 Fintech Explanation Engine
 Generates mandatory explanation objects for all API responses
 """
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter, gt, lt
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from app.schemas.fintech import (
     ExplanationObject, ContributingFactor, SensitivityAnalysis, ScenarioImpact,
     InfluencingFactor, ConfidenceAssessment, HumanReviewGuidance
 )
 from datetime import datetime
+import time
+
+
+# Sort key for ranking contributing factors (bound once, reused per call)
+_BY_IMPACT = attrgetter("impact_score")
+
+# Category sets used in membership tests
+_STRONG_CREDIT_BANDS = frozenset({"excellent", "good"})
+_DIGITAL_CHANNELS = frozenset({"online", "mobile"})
+_HIGH_RISK_LEVELS = frozenset({"high", "very_high"})
+_CLEAR_AML_LEVELS = frozenset({"low", "very_high"})
+_STRESSED_STATES = frozenset({"stressed", "volatile"})
+
+# Decision summaries keyed by model output label; unknown labels fall back
+# to the most severe wording, as the original else branches did
+_KYC_SUMMARY_BY_LEVEL = {
+    "low": "Low AML risk. Customer profile indicates standard retail customer with minimal risk factors.",
+    "medium": "Medium AML risk. Some risk factors present but within acceptable parameters.",
+    "high": "High AML risk. Multiple risk factors detected requiring enhanced due diligence."
+}
+_KYC_DEFAULT_SUMMARY = "Very high AML risk. Customer profile exhibits significant red flags requiring immediate escalation."
+_MARKET_SUMMARY_BY_STATE = {
+    "calm": "Market in calm state. Low volatility and stable conditions observed.",
+    "stressed": "Market experiencing stress. Elevated volatility and uncertainty detected."
+}
+_MARKET_DEFAULT_SUMMARY = "Market in volatile state. High volatility and rapid changes observed."
+
+
+class _NowCache:
+    """
+    Coarse wall-clock timestamp for explanation metadata
+    Refreshes datetime.now() at most every 100 ms; inference timestamps are
+    informational, so sub-100 ms precision is not needed.
+    """
+    _TTL_NS = 100_000_000
+    
+    def __init__(self):
+        self._value = datetime.now()
+        self._expires_ns = time.monotonic_ns() + self._TTL_NS
+    
+    def get(self) -> datetime:
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._expires_ns:
+            self._value = datetime.now()
+            self._expires_ns = now_ns + self._TTL_NS
+        return self._value
+
+
+_now_cache = _NowCache()
+
+
+def _clamp_pm(value: float, delta: float = 0.2) -> Tuple[float, float]:
+    """Return (value - delta, value + delta) clamped to [0, 1] without max/min calls"""
+    low = value - delta
+    high = value + delta
+    return (low if low > 0.0 else 0.0), (high if high < 1.0 else 1.0)
+
+
+# Feature-derived pieces for calls with an empty feature dict (degraded mode,
+# health checks). Built once at import; they match what the rules produce from
+# the per-feature defaults, so the empty path skips rule evaluation entirely.
+_CREDIT_EMPTY_DTI = 0.3
+_CREDIT_EMPTY_DTI_LOW, _CREDIT_EMPTY_DTI_HIGH = _clamp_pm(_CREDIT_EMPTY_DTI, 0.1)
+_CREDIT_EMPTY_DTI_SENSITIVITY = SensitivityAnalysis(
+    parameter="Debt-to-Income Ratio",
+    baseline_value=_CREDIT_EMPTY_DTI,
+    sensitivity_range={"low": _CREDIT_EMPTY_DTI_LOW, "high": _CREDIT_EMPTY_DTI_HIGH},
+    impact_description="Risk increases non-linearly as DTI exceeds 40%"
+)
+_FRAUD_EMPTY_FACTORS = (
+    ContributingFactor(
+        factor_name="Transaction Channel",
+        impact_score=0.15,
+        direction="increases",
+        explanation="Online/mobile channels have higher fraud risk due to reduced authentication"
+    ),
+)
+_FRAUD_EMPTY_SENSITIVITY = (
+    SensitivityAnalysis(
+        parameter="Transaction Amount",
+        baseline_value=0.0,
+        sensitivity_range={"low": 0.0, "high": 0.0},
+        impact_description="Fraud probability increases non-linearly with transaction amount, especially for unusual amounts"
+    ),
+)
+_KYC_EMPTY_FACTORS = (
+    ContributingFactor(
+        factor_name="Jurisdiction Risk",
+        impact_score=0.15,
+        direction="decreases",
+        explanation="Low-risk jurisdiction reduces AML concerns"
+    ),
+)
+_KYC_EMPTY_NETWORK_LOW, _KYC_EMPTY_NETWORK_HIGH = _clamp_pm(0.3)
+_KYC_EMPTY_SENSITIVITY = (
+    SensitivityAnalysis(
+        parameter="Network Complexity",
+        baseline_value=0.3,
+        sensitivity_range={"low": _KYC_EMPTY_NETWORK_LOW, "high": _KYC_EMPTY_NETWORK_HIGH},
+        impact_description="AML risk increases significantly as network complexity exceeds 0.6"
+    ),
+)
+
+# Confidence tiers are (threshold, level, reason), scanned in order by
+# _pick_tier; the last tier catches everything below the others.
+_CREDIT_CONF_TIERS = (
+    (0.85, "high", "Strong historical data patterns and consistent borrower information support this assessment."),
+    (0.70, "medium", "Good information quality, but some factors have limited historical precedent in similar conditions."),
+    (float("-inf"), "low", "Limited or inconsistent information, or conditions that deviate significantly from historical patterns.")
+)
+_FRAUD_CONF_TIERS = (
+    (0.85, "high", "Strong behavioral patterns and clear transaction context support this assessment."),
+    (0.70, "medium", "Good transaction data, but some patterns are ambiguous or have limited historical precedent."),
+    (float("-inf"), "low", "Limited transaction history or conflicting behavioral signals reduce confidence.")
+)
+_KYC_CONF_TIERS = (
+    (0.85, "high", "Strong identity verification and clear risk profile patterns support this assessment."),
+    (0.70, "medium", "Good customer data, but some risk factors have limited historical precedent or are ambiguous."),
+    (float("-inf"), "low", "Limited customer information or conflicting risk signals reduce confidence.")
+)
+
+# Invariant Decision Walkthrough text for the market signal and regime
+# simulation explanations.
+_MARKET_INFO_CATEGORIES = (
+    "Market volatility and price movements",
+    "Liquidity conditions and trading activity",
+    "News sentiment and market signals",
+    "Historical market stress patterns",
+    "Comparison with similar market environments"
+)
+_MARKET_DECISION_FLOW = (
+    "Identified patterns similar to past market stress periods",
+    "Compared current market conditions against expected norms",
+    "Evaluated volatility, liquidity, and sentiment signals",
+    "Assessed deviation from calm market characteristics",
+    "Summarized market stress into a decision signal"
+)
+_MARKET_SENSITIVITY_TRIGGERS = (
+    "Market conditions shift rapidly (volatility spikes, liquidity changes, news events)",
+    "Sentiment indicators change significantly (news flow, economic data releases)",
+    "Additional market data or longer time horizon becomes available"
+)
+_MARKET_CONF_TIERS = (
+    (0.85, "high", "Strong market data patterns and clear stress indicators support this assessment."),
+    (0.70, "medium", "Good market data, but some conditions have limited historical precedent or are rapidly changing."),
+    (float("-inf"), "low", "Limited market data or rapidly changing conditions reduce confidence.")
+)
+
+_REGIME_INFO_CATEGORIES = (
+    "Market volatility and return patterns",
+    "Liquidity conditions and market depth",
+    "Asset correlation patterns",
+    "Historical regime transition patterns",
+    "Stress scenario indicators"
+)
+_REGIME_DECISION_FLOW = (
+    "Identified patterns similar to past regime transitions",
+    "Compared current market conditions against regime characteristics",
+    "Evaluated volatility, correlation, and liquidity stress indicators",
+    "Assessed probability of regime change based on stress levels",
+    "Summarized regime state and transition likelihood into a decision signal"
+)
+_REGIME_SENSITIVITY_TRIGGERS = (
+    "Market stress indicators change rapidly (volatility shocks, liquidity crises, correlation breakdowns)",
+    "Regime transition conditions evolve (stress levels, market structure changes)",
+    "Additional market data or longer simulation horizon becomes available"
+)
+_REGIME_CONF_TIERS = (
+    (0.85, "high", "Strong regime patterns and clear stress indicators support this assessment."),
+    (0.70, "medium", "Good market data, but regime transitions are probabilistic and conditions may change."),
+    (float("-inf"), "low", "Limited historical precedent or rapidly changing conditions reduce confidence in regime assessment.")
+)
+
+
+def _pick_tier(score: float, tiers: Tuple[Tuple[float, str, str], ...]) -> Tuple[str, str]:
+    """Return (level, reason) of the first tier whose threshold the score meets"""
+    for threshold, level, reason in tiers:
+        if score >= threshold:
+            return level, reason
+    # NaN scores compare false everywhere; treat them as the lowest tier
+    return tiers[-1][1], tiers[-1][2]
+
+
+@lru_cache(maxsize=64)
+def _market_decision_change(scenario_name: str) -> str:
+    """Scenario impact wording for market signals (few distinct scenarios)"""
+    return f"Scenario '{scenario_name}' adjusts market stress assessment"
+
+
+@lru_cache(maxsize=64)
+def _regime_decision_change(scenario_name: str) -> str:
+    """Scenario impact wording for regime simulations (few distinct scenarios)"""
+    return f"Scenario '{scenario_name}' simulates regime transition conditions"
+
+
+@dataclass(frozen=True)
+class _DomainSpec:
+    """
+    Invariant parts of a table-driven explanation
+    factor_rules entries are (signal, compare, threshold, factor_name,
+    impact_score, direction, explanation_template), listed by descending
+    impact so the factors that fire come out already ranked.
+    """
+    decision_objective: str
+    info_categories: Tuple[str, ...]
+    decision_flow: Tuple[str, ...]
+    sensitivity_triggers: Tuple[str, ...]
+    conf_tiers: Tuple[Tuple[float, str, str], ...]
+    factor_rules: Tuple[Tuple[str, Callable[[float, float], bool], float, str, float, str, str], ...]
+    sensitivity_signal: str
+    sensitivity_parameter: str
+    sensitivity_description: str
+    scenario_adjustment_keys: Tuple[str, ...]
+    decision_change: Callable[[str], str]
+    uncertainty_notes: str
+    review_reason_recommended: str
+    review_reason_standard: str
+
+
+_MARKET_SPEC = _DomainSpec(
+    decision_objective="This system evaluated current market stress levels and sentiment conditions to support trading and risk management decisions.",
+    info_categories=_MARKET_INFO_CATEGORIES,
+    decision_flow=_MARKET_DECISION_FLOW,
+    sensitivity_triggers=_MARKET_SENSITIVITY_TRIGGERS,
+    conf_tiers=_MARKET_CONF_TIERS,
+    factor_rules=(
+        ("volatility", gt, 0.5, "Market Volatility", 0.30, "increases",
+         "Elevated volatility ({:.1%}) indicates market stress"),
+        ("liquidity", lt, 0.4, "Liquidity Conditions", 0.25, "increases",
+         "Reduced liquidity ({:.1%}) increases market stress"),
+        ("sentiment", lt, -0.3, "Market Sentiment", 0.20, "increases",
+         "Negative sentiment ({:.2f}) contributes to market stress"),
+    ),
+    sensitivity_signal="volatility",
+    sensitivity_parameter="Volatility Index",
+    sensitivity_description="Stress state transitions occur around volatility thresholds of 0.3 (calm to stressed) and 0.6 (stressed to volatile)",
+    scenario_adjustment_keys=("volatility_bias", "sentiment_bias"),
+    decision_change=_market_decision_change,
+    uncertainty_notes="Market conditions can change rapidly. Continuous monitoring recommended.",
+    review_reason_recommended="Human review is recommended because market stress is elevated, conditions are volatile, or the assessment is borderline.",
+    review_reason_standard="Standard automated monitoring is appropriate. Market conditions align with stable patterns."
+)
+
+_REGIME_SPEC = _DomainSpec(
+    decision_objective="This system evaluated current market regime and likelihood of regime transition to support portfolio risk management and trading strategy decisions.",
+    info_categories=_REGIME_INFO_CATEGORIES,
+    decision_flow=_REGIME_DECISION_FLOW,
+    sensitivity_triggers=_REGIME_SENSITIVITY_TRIGGERS,
+    conf_tiers=_REGIME_CONF_TIERS,
+    factor_rules=(
+        ("volatility_shock", gt, 0.5, "Volatility Shock", 0.30, "increases",
+         "Significant volatility shock ({:.1%}) drives regime transition"),
+        ("liquidity_crisis", gt, 0.5, "Liquidity Crisis", 0.28, "increases",
+         "Liquidity crisis conditions ({:.1%}) force regime transition"),
+        ("correlation_breakdown", gt, 0.6, "Correlation Breakdown", 0.25, "increases",
+         "Asset correlation breakdown ({:.1%}) indicates regime shift"),
+    ),
+    sensitivity_signal="volatility_shock",
+    sensitivity_parameter="Volatility Shock Level",
+    sensitivity_description="Regime transition probability increases sharply as volatility shock exceeds 0.6",
+    scenario_adjustment_keys=("volatility_shock_level", "correlation_breakdown_score"),
+    decision_change=_regime_decision_change,
+    uncertainty_notes="Regime transitions are probabilistic. Multiple scenarios should be considered.",
+    review_reason_recommended="Human review is recommended because regime transition probability is elevated, stress indicators are significant, or the regime assessment is uncertain.",
+    review_reason_standard="Standard automated monitoring is appropriate. Regime appears stable with low transition probability."
+)
 
 
 class FintechExplanationEngine:
@@ -30,6 +299,12 @@ class FintechExplanationEngine:
     ) -> ExplanationObject:
         """Generate explanation for credit risk assessment"""
         
+        # Scenario parameters (each read once)
+        scenario_name = scenario_params.get("name", "Unknown")
+        confidence_degradation = scenario_params.get("confidence_degradation", 0.0)
+        pd_sensitivity = scenario_params.get("default_probability_sensitivity", 1.0)
+        macro_context = scenario_params.get("macro_context", {})
+        
         # Decision summary
         if risk_score >= 0.8:
             risk_level = "low"
@@ -48,58 +323,71 @@ class FintechExplanationEngine:
         confidence_score = 0.85
         if default_probability < 0.1 or default_probability > 0.5:
             confidence_score = 0.90  # More confident at extremes
-        elif scenario_params.get("confidence_degradation", 0) > 0:
-            confidence_score -= scenario_params["confidence_degradation"]
+        elif confidence_degradation > 0:
+            confidence_score -= confidence_degradation
         
         # Top contributing factors
         contributing_factors = []
         
-        # Credit score band
-        credit_score_band = borrower_features.get("credit_score_band", "fair")
-        if credit_score_band in ["excellent", "good"]:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Credit History Quality",
-                impact_score=0.25,
-                direction="decreases",
-                explanation=f"Strong credit history ({credit_score_band}) significantly reduces default risk"
-            ))
-        elif credit_score_band == "poor":
-            contributing_factors.append(ContributingFactor(
-                factor_name="Credit History Quality",
-                impact_score=0.30,
-                direction="increases",
-                explanation=f"Poor credit history significantly increases default risk"
-            ))
-        
-        # Debt-to-income ratio
-        dti = borrower_features.get("debt_to_income_ratio", 0.3)
-        if dti > 0.4:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Debt-to-Income Ratio",
-                impact_score=0.20,
-                direction="increases",
-                explanation=f"High debt-to-income ratio ({dti:.1%}) indicates financial stress"
-            ))
-        elif dti < 0.25:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Debt-to-Income Ratio",
-                impact_score=0.15,
-                direction="decreases",
-                explanation=f"Low debt-to-income ratio ({dti:.1%}) indicates strong financial capacity"
-            ))
-        
-        # Employment stability
-        emp_stability = borrower_features.get("employment_stability_score", 0.5)
-        if emp_stability < 0.4:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Employment Stability",
-                impact_score=0.18,
-                direction="increases",
-                explanation=f"Low employment stability ({emp_stability:.1%}) increases income uncertainty"
-            ))
+        # Empty feature dicts reuse the precomputed default-feature outcome
+        if not borrower_features:
+            dti = _CREDIT_EMPTY_DTI
+            dti_sensitivity = _CREDIT_EMPTY_DTI_SENSITIVITY
+        else:
+            # Credit score band
+            credit_score_band = borrower_features.get("credit_score_band", "fair")
+            if credit_score_band in _STRONG_CREDIT_BANDS:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Credit History Quality",
+                    impact_score=0.25,
+                    direction="decreases",
+                    explanation=f"Strong credit history ({credit_score_band}) significantly reduces default risk"
+                ))
+            elif credit_score_band == "poor":
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Credit History Quality",
+                    impact_score=0.30,
+                    direction="increases",
+                    explanation=f"Poor credit history significantly increases default risk"
+                ))
+            
+            # Debt-to-income ratio
+            dti = borrower_features.get("debt_to_income_ratio", 0.3)
+            if dti > 0.4:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Debt-to-Income Ratio",
+                    impact_score=0.20,
+                    direction="increases",
+                    explanation=f"High debt-to-income ratio ({dti:.1%}) indicates financial stress"
+                ))
+            elif dti < 0.25:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Debt-to-Income Ratio",
+                    impact_score=0.15,
+                    direction="decreases",
+                    explanation=f"Low debt-to-income ratio ({dti:.1%}) indicates strong financial capacity"
+                ))
+            
+            # Employment stability
+            emp_stability = borrower_features.get("employment_stability_score", 0.5)
+            if emp_stability < 0.4:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Employment Stability",
+                    impact_score=0.18,
+                    direction="increases",
+                    explanation=f"Low employment stability ({emp_stability:.1%}) increases income uncertainty"
+                ))
+            
+            dti_low, dti_high = _clamp_pm(dti, 0.1)
+            dti_sensitivity = SensitivityAnalysis(
+                parameter="Debt-to-Income Ratio",
+                baseline_value=dti,
+                sensitivity_range={"low": dti_low, "high": dti_high},
+                impact_description="Risk increases non-linearly as DTI exceeds 40%"
+            )
         
         # Economic context
-        economic_stress = scenario_params.get("macro_context", {}).get("economic_stress_level", 0.2)
+        economic_stress = macro_context.get("economic_stress_level", 0.2)
         if economic_stress > 0.5:
             contributing_factors.append(ContributingFactor(
                 factor_name="Economic Environment",
@@ -108,46 +396,41 @@ class FintechExplanationEngine:
                 explanation=f"Elevated economic stress ({economic_stress:.1%}) increases systemic default risk"
             ))
         
-        # Sort by impact
-        contributing_factors.sort(key=lambda x: x.impact_score, reverse=True)
-        contributing_factors = contributing_factors[:5]  # Top 5
+        # Sort by impact (at most four rules fire, so no top-5 cut is needed)
+        contributing_factors.sort(key=_BY_IMPACT, reverse=True)
         
         # Sensitivity analysis
+        interest_rate = macro_context.get("interest_rate_level", 2.5)
         sensitivity_analysis = [
             SensitivityAnalysis(
                 parameter="Interest Rate",
-                baseline_value=scenario_params.get("macro_context", {}).get("interest_rate_level", 2.5),
+                baseline_value=interest_rate,
                 sensitivity_range={
-                    "low": scenario_params.get("macro_context", {}).get("interest_rate_level", 2.5) - 1.0,
-                    "high": scenario_params.get("macro_context", {}).get("interest_rate_level", 2.5) + 2.0
+                    "low": interest_rate - 1.0,
+                    "high": interest_rate + 2.0
                 },
-                impact_description=f"Risk increases by approximately {scenario_params.get('default_probability_sensitivity', 1.0) * 0.3:.1%} for each 1% increase in interest rates"
+                impact_description=f"Risk increases by approximately {pd_sensitivity * 0.3:.1%} for each 1% increase in interest rates"
             ),
-            SensitivityAnalysis(
-                parameter="Debt-to-Income Ratio",
-                baseline_value=dti,
-                sensitivity_range={"low": max(0.0, dti - 0.1), "high": min(1.0, dti + 0.1)},
-                impact_description="Risk increases non-linearly as DTI exceeds 40%"
-            )
+            dti_sensitivity
         ]
         
         # Scenario impact
         scenario_impact = ScenarioImpact(
-            scenario_name=scenario_params.get("name", "Unknown"),
+            scenario_name=scenario_name,
             scenario_adjustment={
-                "default_probability_multiplier": scenario_params.get("default_probability_sensitivity", 1.0),
-                "confidence_adjustment": scenario_params.get("confidence_degradation", 0.0)
+                "default_probability_multiplier": pd_sensitivity,
+                "confidence_adjustment": confidence_degradation
             },
-            decision_change=f"Scenario '{scenario_params.get('name', 'Unknown')}' adjusts default probability by {((scenario_params.get('default_probability_sensitivity', 1.0) - 1.0) * 100):.0f}%",
-            confidence_impact=-scenario_params.get("confidence_degradation", 0.0)
+            decision_change=f"Scenario '{scenario_name}' adjusts default probability by {((pd_sensitivity - 1.0) * 100):.0f}%",
+            confidence_impact=-confidence_degradation
         )
         
         # Uncertainty notes
         uncertainty_notes = None
         if default_probability > 0.3 and default_probability < 0.7:
             uncertainty_notes = "Risk assessment in moderate range - limited historical data in similar conditions. Consider additional verification."
-        elif scenario_params.get("confidence_degradation", 0) > 0.1:
-            uncertainty_notes = f"Scenario uncertainty reduces confidence. Economic conditions ({scenario_params.get('name', 'Unknown')}) may deviate from historical patterns."
+        elif confidence_degradation > 0.1:
+            uncertainty_notes = f"Scenario uncertainty reduces confidence. Economic conditions ({scenario_name}) may deviate from historical patterns."
         
         # Human review recommendation
         human_review_recommended = (
@@ -181,24 +464,17 @@ class FintechExplanationEngine:
         ]
         
         # Section 4: What Influenced This Result the Most
-        top_influencing_factors_list = []
-        for factor in contributing_factors[:5]:  # Top 5
-            top_influencing_factors_list.append(InfluencingFactor(
+        top_influencing_factors_list = [
+            InfluencingFactor(
                 factor_name=factor.factor_name,
                 influence_direction=factor.direction,
                 short_reason=factor.explanation
-            ))
+            )
+            for factor in contributing_factors
+        ]
         
         # Section 5: Confidence & Reliability
-        if confidence_score >= 0.85:
-            conf_level = "high"
-            conf_reason = "Strong historical data patterns and consistent borrower information support this assessment."
-        elif confidence_score >= 0.70:
-            conf_level = "medium"
-            conf_reason = "Good information quality, but some factors have limited historical precedent in similar conditions."
-        else:
-            conf_level = "low"
-            conf_reason = "Limited or inconsistent information, or conditions that deviate significantly from historical patterns."
+        conf_level, conf_reason = _pick_tier(confidence_score, _CREDIT_CONF_TIERS)
         
         confidence_assessment = ConfidenceAssessment(
             confidence_level=conf_level,
@@ -242,7 +518,7 @@ class FintechExplanationEngine:
             uncertainty_notes=uncertainty_notes,
             human_review_recommended=human_review_recommended,
             model_version=model_metadata.get("model_version", "1.0.0"),
-            inference_timestamp=datetime.now()
+            inference_timestamp=_now_cache.get()
         )
     
     def generate_fraud_detection_explanation(
@@ -268,73 +544,78 @@ class FintechExplanationEngine:
         confidence_score = min(0.95, 0.7 + abs(fraud_probability - 0.5) * 0.5)
         
         # Top contributing factors
-        contributing_factors = []
-        
-        # Amount deviation
-        amount_deviation = transaction_features.get("amount_deviation", 0.0)
-        if amount_deviation > 0.5:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Transaction Amount Anomaly",
-                impact_score=0.25,
-                direction="increases",
-                explanation=f"Transaction amount significantly deviates from typical patterns ({amount_deviation:.1%} deviation)"
-            ))
-        
-        # Geo deviation
-        geo_deviation = transaction_features.get("geo_deviation", False)
-        if geo_deviation:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Geographic Anomaly",
-                impact_score=0.30,
-                direction="increases",
-                explanation="Transaction from unusual geographic location compared to account history"
-            ))
-        
-        # Velocity
-        velocity_anomaly = transaction_features.get("velocity_anomaly", False)
-        if velocity_anomaly:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Transaction Velocity",
-                impact_score=0.20,
-                direction="increases",
-                explanation="Unusual transaction velocity detected - potential card testing or account takeover"
-            ))
-        
-        # Channel type
-        channel_type = transaction_features.get("channel_type", "online")
-        if channel_type in ["online", "mobile"]:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Transaction Channel",
-                impact_score=0.15,
-                direction="increases",
-                explanation="Online/mobile channels have higher fraud risk due to reduced authentication"
-            ))
-        
-        # Sort by impact
-        contributing_factors.sort(key=lambda x: x.impact_score, reverse=True)
-        contributing_factors = contributing_factors[:5]
-        
-        # Sensitivity analysis
-        sensitivity_analysis = [
-            SensitivityAnalysis(
-                parameter="Transaction Amount",
-                baseline_value=transaction_features.get("amount", 0.0),
-                sensitivity_range={
-                    "low": transaction_features.get("amount", 0.0) * 0.5,
-                    "high": transaction_features.get("amount", 0.0) * 2.0
-                },
-                impact_description="Fraud probability increases non-linearly with transaction amount, especially for unusual amounts"
-            )
-        ]
+        # Empty feature dicts reuse the precomputed default-feature outcome
+        if not transaction_features:
+            contributing_factors = list(_FRAUD_EMPTY_FACTORS)
+            sensitivity_analysis = list(_FRAUD_EMPTY_SENSITIVITY)
+        else:
+            contributing_factors = []
+            
+            # Amount deviation
+            amount_deviation = transaction_features.get("amount_deviation", 0.0)
+            if amount_deviation > 0.5:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Transaction Amount Anomaly",
+                    impact_score=0.25,
+                    direction="increases",
+                    explanation=f"Transaction amount significantly deviates from typical patterns ({amount_deviation:.1%} deviation)"
+                ))
+            
+            # Geo deviation
+            geo_deviation = transaction_features.get("geo_deviation", False)
+            if geo_deviation:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Geographic Anomaly",
+                    impact_score=0.30,
+                    direction="increases",
+                    explanation="Transaction from unusual geographic location compared to account history"
+                ))
+            
+            # Velocity
+            velocity_anomaly = transaction_features.get("velocity_anomaly", False)
+            if velocity_anomaly:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Transaction Velocity",
+                    impact_score=0.20,
+                    direction="increases",
+                    explanation="Unusual transaction velocity detected - potential card testing or account takeover"
+                ))
+            
+            # Channel type
+            channel_type = transaction_features.get("channel_type", "online")
+            if channel_type in _DIGITAL_CHANNELS:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Transaction Channel",
+                    impact_score=0.15,
+                    direction="increases",
+                    explanation="Online/mobile channels have higher fraud risk due to reduced authentication"
+                ))
+            
+            # Sort by impact (at most four rules fire, so no top-5 cut is needed)
+            contributing_factors.sort(key=_BY_IMPACT, reverse=True)
+            
+            # Sensitivity analysis
+            sensitivity_analysis = [
+                SensitivityAnalysis(
+                    parameter="Transaction Amount",
+                    baseline_value=transaction_features.get("amount", 0.0),
+                    sensitivity_range={
+                        "low": transaction_features.get("amount", 0.0) * 0.5,
+                        "high": transaction_features.get("amount", 0.0) * 2.0
+                    },
+                    impact_description="Fraud probability increases non-linearly with transaction amount, especially for unusual amounts"
+                )
+            ]
         
         # Scenario impact
+        scenario_name = scenario_params.get("name", "Unknown")
         scenario_impact = ScenarioImpact(
-            scenario_name=scenario_params.get("name", "Unknown"),
+            scenario_name=scenario_name,
             scenario_adjustment={
                 "fraud_probability_bias": scenario_params.get("fraud_probability_bias", 0.0),
                 "velocity_threshold": scenario_params.get("velocity_threshold_multiplier", 1.0)
             },
-            decision_change=f"Scenario '{scenario_params.get('name', 'Unknown')}' adjusts fraud detection sensitivity",
+            decision_change=f"Scenario '{scenario_name}' adjusts fraud detection sensitivity",
             confidence_impact=0.0
         )
         
@@ -370,24 +651,17 @@ class FintechExplanationEngine:
         ]
         
         # Section 4: What Influenced This Result the Most
-        top_influencing_factors_list = []
-        for factor in contributing_factors[:5]:
-            top_influencing_factors_list.append(InfluencingFactor(
+        top_influencing_factors_list = [
+            InfluencingFactor(
                 factor_name=factor.factor_name,
                 influence_direction=factor.direction,
                 short_reason=factor.explanation
-            ))
+            )
+            for factor in contributing_factors
+        ]
         
         # Section 5: Confidence & Reliability
-        if confidence_score >= 0.85:
-            conf_level = "high"
-            conf_reason = "Strong behavioral patterns and clear transaction context support this assessment."
-        elif confidence_score >= 0.70:
-            conf_level = "medium"
-            conf_reason = "Good transaction data, but some patterns are ambiguous or have limited historical precedent."
-        else:
-            conf_level = "low"
-            conf_reason = "Limited transaction history or conflicting behavioral signals reduce confidence."
+        conf_level, conf_reason = _pick_tier(confidence_score, _FRAUD_CONF_TIERS)
         
         confidence_assessment = ConfidenceAssessment(
             confidence_level=conf_level,
@@ -431,7 +705,7 @@ class FintechExplanationEngine:
             uncertainty_notes=uncertainty_notes,
             human_review_recommended=human_review_recommended,
             model_version=model_metadata.get("model_version", "1.0.0"),
-            inference_timestamp=datetime.now()
+            inference_timestamp=_now_cache.get()
         )
     
     def generate_kyc_aml_explanation(
@@ -446,93 +720,92 @@ class FintechExplanationEngine:
         """Generate explanation for KYC/AML risk assessment"""
         
         # Decision summary
-        if aml_risk_level == "low":
-            decision_summary = "Low AML risk. Customer profile indicates standard retail customer with minimal risk factors."
-        elif aml_risk_level == "medium":
-            decision_summary = "Medium AML risk. Some risk factors present but within acceptable parameters."
-        elif aml_risk_level == "high":
-            decision_summary = "High AML risk. Multiple risk factors detected requiring enhanced due diligence."
-        else:
-            decision_summary = "Very high AML risk. Customer profile exhibits significant red flags requiring immediate escalation."
+        decision_summary = _KYC_SUMMARY_BY_LEVEL.get(aml_risk_level, _KYC_DEFAULT_SUMMARY)
         
         # Confidence score
         confidence_score = 0.80
-        if aml_risk_level in ["low", "very_high"]:
+        if aml_risk_level in _CLEAR_AML_LEVELS:
             confidence_score = 0.90
         
         # Top contributing factors
-        contributing_factors = []
-        
-        # Jurisdiction risk
-        jurisdiction_risk = customer_features.get("jurisdiction_risk", "low")
-        if jurisdiction_risk in ["high", "very_high"]:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Jurisdiction Risk",
-                impact_score=0.30,
-                direction="increases",
-                explanation=f"High-risk jurisdiction with potential sanctions exposure"
-            ))
-        elif jurisdiction_risk == "low":
-            contributing_factors.append(ContributingFactor(
-                factor_name="Jurisdiction Risk",
-                impact_score=0.15,
-                direction="decreases",
-                explanation="Low-risk jurisdiction reduces AML concerns"
-            ))
-        
-        # Occupation risk
-        occupation_risk = customer_features.get("occupation_risk_level", "low")
-        if occupation_risk == "high":
-            contributing_factors.append(ContributingFactor(
-                factor_name="Occupation Risk",
-                impact_score=0.25,
-                direction="increases",
-                explanation="High-risk occupation (e.g., PEP, cash-intensive business) increases AML risk"
-            ))
-        
-        # Network complexity
-        network_complexity = customer_features.get("network_complexity_score", 0.3)
-        if network_complexity > 0.6:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Relationship Network",
-                impact_score=0.20,
-                direction="increases",
-                explanation=f"Complex relationship network ({network_complexity:.1%}) with potential high-risk links"
-            ))
-        
-        # Identity verification
-        identity_scores = customer_features.get("identity_verification_scores", {})
-        avg_identity_score = sum(identity_scores.values()) / len(identity_scores) if identity_scores else 0.9
-        if avg_identity_score < 0.7:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Identity Verification",
-                impact_score=0.18,
-                direction="increases",
-                explanation="Lower identity verification scores indicate potential identity concerns"
-            ))
-        
-        # Sort by impact
-        contributing_factors.sort(key=lambda x: x.impact_score, reverse=True)
-        contributing_factors = contributing_factors[:5]
-        
-        # Sensitivity analysis
-        sensitivity_analysis = [
-            SensitivityAnalysis(
-                parameter="Network Complexity",
-                baseline_value=network_complexity,
-                sensitivity_range={"low": max(0.0, network_complexity - 0.2), "high": min(1.0, network_complexity + 0.2)},
-                impact_description="AML risk increases significantly as network complexity exceeds 0.6"
-            )
-        ]
+        # Empty feature dicts reuse the precomputed default-feature outcome
+        if not customer_features:
+            contributing_factors = list(_KYC_EMPTY_FACTORS)
+            sensitivity_analysis = list(_KYC_EMPTY_SENSITIVITY)
+        else:
+            contributing_factors = []
+            
+            # Jurisdiction risk
+            jurisdiction_risk = customer_features.get("jurisdiction_risk", "low")
+            if jurisdiction_risk in _HIGH_RISK_LEVELS:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Jurisdiction Risk",
+                    impact_score=0.30,
+                    direction="increases",
+                    explanation=f"High-risk jurisdiction with potential sanctions exposure"
+                ))
+            elif jurisdiction_risk == "low":
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Jurisdiction Risk",
+                    impact_score=0.15,
+                    direction="decreases",
+                    explanation="Low-risk jurisdiction reduces AML concerns"
+                ))
+            
+            # Occupation risk
+            occupation_risk = customer_features.get("occupation_risk_level", "low")
+            if occupation_risk == "high":
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Occupation Risk",
+                    impact_score=0.25,
+                    direction="increases",
+                    explanation="High-risk occupation (e.g., PEP, cash-intensive business) increases AML risk"
+                ))
+            
+            # Network complexity
+            network_complexity = customer_features.get("network_complexity_score", 0.3)
+            if network_complexity > 0.6:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Relationship Network",
+                    impact_score=0.20,
+                    direction="increases",
+                    explanation=f"Complex relationship network ({network_complexity:.1%}) with potential high-risk links"
+                ))
+            
+            # Identity verification
+            identity_scores = customer_features.get("identity_verification_scores", {})
+            avg_identity_score = sum(identity_scores.values()) / len(identity_scores) if identity_scores else 0.9
+            if avg_identity_score < 0.7:
+                contributing_factors.append(ContributingFactor(
+                    factor_name="Identity Verification",
+                    impact_score=0.18,
+                    direction="increases",
+                    explanation="Lower identity verification scores indicate potential identity concerns"
+                ))
+            
+            # Sort by impact (at most four rules fire, so no top-5 cut is needed)
+            contributing_factors.sort(key=_BY_IMPACT, reverse=True)
+            
+            # Sensitivity analysis
+            network_low, network_high = _clamp_pm(network_complexity)
+            sensitivity_analysis = [
+                SensitivityAnalysis(
+                    parameter="Network Complexity",
+                    baseline_value=network_complexity,
+                    sensitivity_range={"low": network_low, "high": network_high},
+                    impact_description="AML risk increases significantly as network complexity exceeds 0.6"
+                )
+            ]
         
         # Scenario impact
+        scenario_name = scenario_params.get("name", "Unknown")
         scenario_impact = ScenarioImpact(
-            scenario_name=scenario_params.get("name", "Unknown"),
+            scenario_name=scenario_name,
             scenario_adjustment={
                 "aml_risk_multiplier": scenario_params.get("aml_risk_bias", 0.0),
                 "jurisdiction_weight": scenario_params.get("jurisdiction_risk_multiplier", 1.0)
             },
-            decision_change=f"Scenario '{scenario_params.get('name', 'Unknown')}' adjusts AML risk assessment",
+            decision_change=f"Scenario '{scenario_name}' adjusts AML risk assessment",
             confidence_impact=0.0
         )
         
@@ -542,7 +815,7 @@ class FintechExplanationEngine:
             uncertainty_notes = "Risk assessment in moderate range. Additional information may clarify risk profile."
         
         # Human review recommendation
-        human_review_recommended = escalation_required or aml_risk_level in ["high", "very_high"]
+        human_review_recommended = escalation_required or aml_risk_level in _HIGH_RISK_LEVELS
         
         # ========== DECISION WALKTHROUGH STRUCTURE ==========
         
@@ -568,24 +841,17 @@ class FintechExplanationEngine:
         ]
         
         # Section 4: What Influenced This Result the Most
-        top_influencing_factors_list = []
-        for factor in contributing_factors[:5]:
-            top_influencing_factors_list.append(InfluencingFactor(
+        top_influencing_factors_list = [
+            InfluencingFactor(
                 factor_name=factor.factor_name,
                 influence_direction=factor.direction,
                 short_reason=factor.explanation
-            ))
+            )
+            for factor in contributing_factors
+        ]
         
         # Section 5: Confidence & Reliability
-        if confidence_score >= 0.85:
-            conf_level = "high"
-            conf_reason = "Strong identity verification and clear risk profile patterns support this assessment."
-        elif confidence_score >= 0.70:
-            conf_level = "medium"
-            conf_reason = "Good customer data, but some risk factors have limited historical precedent or are ambiguous."
-        else:
-            conf_level = "low"
-            conf_reason = "Limited customer information or conflicting risk signals reduce confidence."
+        conf_level, conf_reason = _pick_tier(confidence_score, _KYC_CONF_TIERS)
         
         confidence_assessment = ConfidenceAssessment(
             confidence_level=conf_level,
@@ -629,7 +895,7 @@ class FintechExplanationEngine:
             uncertainty_notes=uncertainty_notes,
             human_review_recommended=human_review_recommended,
             model_version=model_metadata.get("model_version", "1.0.0"),
-            inference_timestamp=datetime.now()
+            inference_timestamp=_now_cache.get()
         )
     
     def generate_market_signal_explanation(
@@ -644,167 +910,27 @@ class FintechExplanationEngine:
         """Generate explanation for market signal intelligence"""
         
         # Decision summary
-        if stress_state == "calm":
-            decision_summary = "Market in calm state. Low volatility and stable conditions observed."
-        elif stress_state == "stressed":
-            decision_summary = "Market experiencing stress. Elevated volatility and uncertainty detected."
-        else:
-            decision_summary = "Market in volatile state. High volatility and rapid changes observed."
+        decision_summary = _MARKET_SUMMARY_BY_STATE.get(stress_state, _MARKET_DEFAULT_SUMMARY)
         
         # Confidence score
         confidence_score = 0.75
         if stress_score < 0.2 or stress_score > 0.8:
             confidence_score = 0.85
         
-        # Top contributing factors
-        contributing_factors = []
+        signals = {
+            "volatility": market_features.get("volatility_index", 0.2),
+            "liquidity": market_features.get("liquidity_index", 0.7),
+            "sentiment": sentiment_index
+        }
         
-        # Volatility
-        volatility = market_features.get("volatility_index", 0.2)
-        if volatility > 0.5:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Market Volatility",
-                impact_score=0.30,
-                direction="increases",
-                explanation=f"Elevated volatility ({volatility:.1%}) indicates market stress"
-            ))
-        
-        # Liquidity
-        liquidity = market_features.get("liquidity_index", 0.7)
-        if liquidity < 0.4:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Liquidity Conditions",
-                impact_score=0.25,
-                direction="increases",
-                explanation=f"Reduced liquidity ({liquidity:.1%}) increases market stress"
-            ))
-        
-        # Sentiment
-        if sentiment_index < -0.3:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Market Sentiment",
-                impact_score=0.20,
-                direction="increases",
-                explanation=f"Negative sentiment ({sentiment_index:.2f}) contributes to market stress"
-            ))
-        
-        # Sort by impact
-        contributing_factors.sort(key=lambda x: x.impact_score, reverse=True)
-        contributing_factors = contributing_factors[:5]
-        
-        # Sensitivity analysis
-        sensitivity_analysis = [
-            SensitivityAnalysis(
-                parameter="Volatility Index",
-                baseline_value=volatility,
-                sensitivity_range={"low": max(0.0, volatility - 0.2), "high": min(1.0, volatility + 0.2)},
-                impact_description="Stress state transitions occur around volatility thresholds of 0.3 (calm to stressed) and 0.6 (stressed to volatile)"
-            )
-        ]
-        
-        # Scenario impact
-        scenario_impact = ScenarioImpact(
-            scenario_name=scenario_params.get("name", "Unknown"),
-            scenario_adjustment={
-                "volatility_bias": scenario_params.get("volatility_bias", 0.0),
-                "sentiment_bias": scenario_params.get("sentiment_bias", 0.0)
-            },
-            decision_change=f"Scenario '{scenario_params.get('name', 'Unknown')}' adjusts market stress assessment",
-            confidence_impact=0.0
-        )
-        
-        # Uncertainty notes
-        uncertainty_notes = "Market conditions can change rapidly. Continuous monitoring recommended."
-        
-        # Human review recommendation
-        human_review_recommended = stress_state in ["stressed", "volatile"]
-        
-        # ========== DECISION WALKTHROUGH STRUCTURE ==========
-        
-        # Section 1: What Question Was Answered?
-        decision_objective = "This system evaluated current market stress levels and sentiment conditions to support trading and risk management decisions."
-        
-        # Section 2: What Information Was Considered
-        information_categories = [
-            "Market volatility and price movements",
-            "Liquidity conditions and trading activity",
-            "News sentiment and market signals",
-            "Historical market stress patterns",
-            "Comparison with similar market environments"
-        ]
-        
-        # Section 3: How the System Reached This Decision
-        decision_flow = [
-            "Identified patterns similar to past market stress periods",
-            "Compared current market conditions against expected norms",
-            "Evaluated volatility, liquidity, and sentiment signals",
-            "Assessed deviation from calm market characteristics",
-            "Summarized market stress into a decision signal"
-        ]
-        
-        # Section 4: What Influenced This Result the Most
-        top_influencing_factors_list = []
-        for factor in contributing_factors[:5]:
-            top_influencing_factors_list.append(InfluencingFactor(
-                factor_name=factor.factor_name,
-                influence_direction=factor.direction,
-                short_reason=factor.explanation
-            ))
-        
-        # Section 5: Confidence & Reliability
-        if confidence_score >= 0.85:
-            conf_level = "high"
-            conf_reason = "Strong market data patterns and clear stress indicators support this assessment."
-        elif confidence_score >= 0.70:
-            conf_level = "medium"
-            conf_reason = "Good market data, but some conditions have limited historical precedent or are rapidly changing."
-        else:
-            conf_level = "low"
-            conf_reason = "Limited market data or rapidly changing conditions reduce confidence."
-        
-        confidence_assessment = ConfidenceAssessment(
-            confidence_level=conf_level,
-            confidence_reason=conf_reason,
-            known_limitations=uncertainty_notes or "No significant limitations identified."
-        )
-        
-        # Section 6: What Would Change This Outcome?
-        sensitivity_triggers = [
-            "Market conditions shift rapidly (volatility spikes, liquidity changes, news events)",
-            "Sentiment indicators change significantly (news flow, economic data releases)",
-            "Additional market data or longer time horizon becomes available"
-        ]
-        
-        # Section 7: Human Review Guidance
-        if human_review_recommended:
-            review_reason = "Human review is recommended because market stress is elevated, conditions are volatile, or the assessment is borderline."
-        else:
-            review_reason = "Standard automated monitoring is appropriate. Market conditions align with stable patterns."
-        
-        human_review_guidance = HumanReviewGuidance(
-            review_recommended=human_review_recommended,
-            review_reason=review_reason
-        )
-        
-        return ExplanationObject(
-            # Decision Walkthrough fields
-            decision_objective=decision_objective,
-            information_categories=information_categories,
-            decision_flow=decision_flow,
-            top_influencing_factors=top_influencing_factors_list,
-            confidence_assessment=confidence_assessment,
-            sensitivity_triggers=sensitivity_triggers,
-            human_review_guidance=human_review_guidance,
-            # Legacy fields
+        return self._build_explanation(
+            _MARKET_SPEC,
+            signals,
             decision_summary=decision_summary,
             confidence_score=confidence_score,
-            top_contributing_factors=contributing_factors,
-            sensitivity_analysis=sensitivity_analysis,
-            scenario_impact=scenario_impact,
-            uncertainty_notes=uncertainty_notes,
-            human_review_recommended=human_review_recommended,
-            model_version=model_metadata.get("model_version", "1.0.0"),
-            inference_timestamp=datetime.now()
+            human_review_recommended=stress_state in _STRESSED_STATES,
+            scenario_params=scenario_params,
+            model_metadata=model_metadata
         )
     
     def generate_regime_simulation_explanation(
@@ -825,148 +951,106 @@ class FintechExplanationEngine:
         else:
             decision_summary = f"Market regime transition expected from '{current_regime}' to '{projected_regime}'. Transition probability: {transition_probability:.1%}."
         
-        # Confidence score
-        confidence_score = regime_confidence
+        signals = {
+            "volatility_shock": stress_indicators.get("volatility_shock", 0.0),
+            "correlation_breakdown": stress_indicators.get("correlation_breakdown", 0.0),
+            "liquidity_crisis": stress_indicators.get("liquidity_crisis", 0.0)
+        }
         
-        # Top contributing factors
-        contributing_factors = []
-        
-        # Volatility shock
-        vol_shock = stress_indicators.get("volatility_shock", 0.0)
-        if vol_shock > 0.5:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Volatility Shock",
-                impact_score=0.30,
-                direction="increases",
-                explanation=f"Significant volatility shock ({vol_shock:.1%}) drives regime transition"
-            ))
-        
-        # Correlation breakdown
-        corr_breakdown = stress_indicators.get("correlation_breakdown", 0.0)
-        if corr_breakdown > 0.6:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Correlation Breakdown",
-                impact_score=0.25,
-                direction="increases",
-                explanation=f"Asset correlation breakdown ({corr_breakdown:.1%}) indicates regime shift"
-            ))
-        
-        # Liquidity crisis
-        liq_crisis = stress_indicators.get("liquidity_crisis", 0.0)
-        if liq_crisis > 0.5:
-            contributing_factors.append(ContributingFactor(
-                factor_name="Liquidity Crisis",
-                impact_score=0.28,
-                direction="increases",
-                explanation=f"Liquidity crisis conditions ({liq_crisis:.1%}) force regime transition"
-            ))
-        
-        # Sort by impact
-        contributing_factors.sort(key=lambda x: x.impact_score, reverse=True)
-        contributing_factors = contributing_factors[:5]
+        return self._build_explanation(
+            _REGIME_SPEC,
+            signals,
+            decision_summary=decision_summary,
+            confidence_score=regime_confidence,
+            human_review_recommended=transition_probability > 0.5 or current_regime != projected_regime,
+            scenario_params=scenario_params,
+            model_metadata=model_metadata
+        )
+    
+    def _build_explanation(
+        self,
+        spec: _DomainSpec,
+        signals: Dict[str, float],
+        decision_summary: str,
+        confidence_score: float,
+        human_review_recommended: bool,
+        scenario_params: Dict[str, Any],
+        model_metadata: Dict[str, Any]
+    ) -> ExplanationObject:
+        """Build a table-driven explanation from a domain spec and its signal values"""
+        
+        # Constructors called inside the comprehensions, bound once as locals
+        make_factor = ContributingFactor
+        make_influencing_factor = InfluencingFactor
+        
+        # Top contributing factors (rules are pre-ranked by impact)
+        contributing_factors = [
+            make_factor(
+                factor_name=factor_name,
+                impact_score=impact_score,
+                direction=direction,
+                explanation=template.format(signals[signal])
+            )
+            for signal, compare, threshold, factor_name, impact_score, direction, template in spec.factor_rules
+            if compare(signals[signal], threshold)
+        ]
         
         # Sensitivity analysis
+        baseline = signals[spec.sensitivity_signal]
+        low, high = _clamp_pm(baseline)
         sensitivity_analysis = [
             SensitivityAnalysis(
-                parameter="Volatility Shock Level",
-                baseline_value=vol_shock,
-                sensitivity_range={"low": max(0.0, vol_shock - 0.2), "high": min(1.0, vol_shock + 0.2)},
-                impact_description="Regime transition probability increases sharply as volatility shock exceeds 0.6"
+                parameter=spec.sensitivity_parameter,
+                baseline_value=baseline,
+                sensitivity_range={"low": low, "high": high},
+                impact_description=spec.sensitivity_description
             )
         ]
         
         # Scenario impact
+        scenario_name = scenario_params.get("name", "Unknown")
         scenario_impact = ScenarioImpact(
-            scenario_name=scenario_params.get("name", "Unknown"),
-            scenario_adjustment={
-                "volatility_shock_level": scenario_params.get("volatility_shock_level", 0.0),
-                "correlation_breakdown_score": scenario_params.get("correlation_breakdown_score", 0.0)
-            },
-            decision_change=f"Scenario '{scenario_params.get('name', 'Unknown')}' simulates regime transition conditions",
+            scenario_name=scenario_name,
+            scenario_adjustment={key: scenario_params.get(key, 0.0) for key in spec.scenario_adjustment_keys},
+            decision_change=spec.decision_change(scenario_name),
             confidence_impact=0.0
         )
         
-        # Uncertainty notes
-        uncertainty_notes = "Regime transitions are probabilistic. Multiple scenarios should be considered."
-        
-        # Human review recommendation
-        human_review_recommended = transition_probability > 0.5 or current_regime != projected_regime
-        
         # ========== DECISION WALKTHROUGH STRUCTURE ==========
         
-        # Section 1: What Question Was Answered?
-        decision_objective = "This system evaluated current market regime and likelihood of regime transition to support portfolio risk management and trading strategy decisions."
-        
-        # Section 2: What Information Was Considered
-        information_categories = [
-            "Market volatility and return patterns",
-            "Liquidity conditions and market depth",
-            "Asset correlation patterns",
-            "Historical regime transition patterns",
-            "Stress scenario indicators"
-        ]
-        
-        # Section 3: How the System Reached This Decision
-        decision_flow = [
-            "Identified patterns similar to past regime transitions",
-            "Compared current market conditions against regime characteristics",
-            "Evaluated volatility, correlation, and liquidity stress indicators",
-            "Assessed probability of regime change based on stress levels",
-            "Summarized regime state and transition likelihood into a decision signal"
-        ]
-        
         # Section 4: What Influenced This Result the Most
-        top_influencing_factors_list = []
-        for factor in contributing_factors[:5]:
-            top_influencing_factors_list.append(InfluencingFactor(
+        top_influencing_factors_list = [
+            make_influencing_factor(
                 factor_name=factor.factor_name,
                 influence_direction=factor.direction,
                 short_reason=factor.explanation
-            ))
+            )
+            for factor in contributing_factors
+        ]
         
         # Section 5: Confidence & Reliability
-        if confidence_score >= 0.85:
-            conf_level = "high"
-            conf_reason = "Strong regime patterns and clear stress indicators support this assessment."
-        elif confidence_score >= 0.70:
-            conf_level = "medium"
-            conf_reason = "Good market data, but regime transitions are probabilistic and conditions may change."
-        else:
-            conf_level = "low"
-            conf_reason = "Limited historical precedent or rapidly changing conditions reduce confidence in regime assessment."
+        conf_level, conf_reason = _pick_tier(confidence_score, spec.conf_tiers)
         
         confidence_assessment = ConfidenceAssessment(
             confidence_level=conf_level,
             confidence_reason=conf_reason,
-            known_limitations=uncertainty_notes or "No significant limitations identified."
+            known_limitations=spec.uncertainty_notes
         )
         
-        # Section 6: What Would Change This Outcome?
-        sensitivity_triggers = [
-            "Market stress indicators change rapidly (volatility shocks, liquidity crises, correlation breakdowns)",
-            "Regime transition conditions evolve (stress levels, market structure changes)",
-            "Additional market data or longer simulation horizon becomes available"
-        ]
-        
         # Section 7: Human Review Guidance
-        if human_review_recommended:
-            review_reason = "Human review is recommended because regime transition probability is elevated, stress indicators are significant, or the regime assessment is uncertain."
-        else:
-            review_reason = "Standard automated monitoring is appropriate. Regime appears stable with low transition probability."
-        
         human_review_guidance = HumanReviewGuidance(
             review_recommended=human_review_recommended,
-            review_reason=review_reason
+            review_reason=spec.review_reason_recommended if human_review_recommended else spec.review_reason_standard
         )
         
         return ExplanationObject(
-            # Decision Walkthrough fields
-            decision_objective=decision_objective,
-            information_categories=information_categories,
-            decision_flow=decision_flow,
+            # Decision Walkthrough fields (sections 1-3 and 6 are invariant per domain)
+            decision_objective=spec.decision_objective,
+            information_categories=spec.info_categories,
+            decision_flow=spec.decision_flow,
             top_influencing_factors=top_influencing_factors_list,
             confidence_assessment=confidence_assessment,
-            sensitivity_triggers=sensitivity_triggers,
+            sensitivity_triggers=spec.sensitivity_triggers,
             human_review_guidance=human_review_guidance,
             # Legacy fields
             decision_summary=decision_summary,
@@ -974,10 +1058,10 @@ class FintechExplanationEngine:
             top_contributing_factors=contributing_factors,
             sensitivity_analysis=sensitivity_analysis,
             scenario_impact=scenario_impact,
-            uncertainty_notes=uncertainty_notes,
+            uncertainty_notes=spec.uncertainty_notes,
             human_review_recommended=human_review_recommended,
             model_version=model_metadata.get("model_version", "1.0.0"),
-            inference_timestamp=datetime.now()
+            inference_timestamp=_now_cache.get()
         )
 
 
@@ -3,7 +3,8 @@ Fintech Scenario Catalog
 User-driven scenarios that map to backend parameters
 Scenarios are NOT data-driven - they adjust model behavior
 """
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from enum import Enum
 
 
@@ -46,209 +47,229 @@ class RegimeSimulationScenario(str, Enum):
     LIQUIDITY_FREEZE = "liquidity_freeze"
 
 
+def _read_only(table: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a scenario table, and every dict nested in it, in read-only views"""
+    return MappingProxyType({
+        key: _read_only(value) if isinstance(value, dict) else value
+        for key, value in table.items()
+    })
+
+
+# Scenario tables are built once at import; lookups return shared read-only
+# views, so callers needing changes copy first (.copy() returns a plain dict)
+_CREDIT_RISK_SCENARIOS = _read_only({
+    "stable_economy": {
+        "name": "Stable Economy",
+        "macro_context": {
+            "interest_rate_level": 2.5,
+            "inflation_index": 0.2,
+            "unemployment_index": 0.15,
+            "economic_stress_level": 0.2
+        },
+        "default_probability_sensitivity": 1.0,  # Baseline
+        "confidence_degradation": 0.0,
+        "description": "Normal economic conditions with stable interest rates and low inflation"
+    },
+    "rising_interest_rates": {
+        "name": "Rising Interest Rates",
+        "macro_context": {
+            "interest_rate_level": 5.5,
+            "inflation_index": 0.4,
+            "unemployment_index": 0.25,
+            "economic_stress_level": 0.5
+        },
+        "default_probability_sensitivity": 1.4,  # 40% increase
+        "confidence_degradation": 0.1,
+        "description": "Rising interest rates increase borrowing costs and default risk"
+    },
+    "economic_downturn": {
+        "name": "Economic Downturn",
+        "macro_context": {
+            "interest_rate_level": 1.5,
+            "inflation_index": 0.3,
+            "unemployment_index": 0.6,
+            "economic_stress_level": 0.8
+        },
+        "default_probability_sensitivity": 2.0,  # 100% increase
+        "confidence_degradation": 0.2,
+        "description": "Economic recession with high unemployment and financial stress"
+    },
+    "high_inflation": {
+        "name": "High Inflation Environment",
+        "macro_context": {
+            "interest_rate_level": 7.0,
+            "inflation_index": 0.8,
+            "unemployment_index": 0.35,
+            "economic_stress_level": 0.6
+        },
+        "default_probability_sensitivity": 1.6,  # 60% increase
+        "confidence_degradation": 0.15,
+        "description": "High inflation erodes purchasing power and increases financial stress"
+    }
+})
+
+
+_FRAUD_DETECTION_SCENARIOS = _read_only({
+    "normal_behavior": {
+        "name": "Normal Transaction Behavior",
+        "velocity_threshold_multiplier": 1.0,
+        "geo_deviation_weight": 1.0,
+        "device_trust_weight": 1.0,
+        "fraud_probability_bias": 0.0,
+        "description": "Standard transaction patterns with normal velocity and location"
+    },
+    "velocity_spike": {
+        "name": "Sudden Velocity Spike",
+        "velocity_threshold_multiplier": 0.5,  # Lower threshold
+        "geo_deviation_weight": 1.2,
+        "device_trust_weight": 1.1,
+        "fraud_probability_bias": 0.2,  # Increase fraud probability
+        "description": "Unusual transaction velocity indicating potential fraud"
+    },
+    "geo_shift": {
+        "name": "Geo-Location Shift",
+        "velocity_threshold_multiplier": 1.0,
+        "geo_deviation_weight": 2.0,  # Double weight on geo
+        "device_trust_weight": 1.5,
+        "fraud_probability_bias": 0.3,
+        "description": "Transaction from unusual geographic location"
+    },
+    "coordinated_fraud": {
+        "name": "Coordinated Fraud Pattern",
+        "velocity_threshold_multiplier": 0.3,
+        "geo_deviation_weight": 1.5,
+        "device_trust_weight": 2.0,
+        "fraud_probability_bias": 0.4,
+        "description": "Pattern suggesting coordinated fraud attack across multiple accounts"
+    }
+})
+
+
+_KYC_AML_SCENARIOS = _read_only({
+    "low_risk_retail": {
+        "name": "Low-Risk Retail Customer",
+        "jurisdiction_risk_multiplier": 0.8,
+        "occupation_risk_weight": 0.5,
+        "network_risk_weight": 0.5,
+        "aml_risk_bias": -0.2,  # Decrease risk
+        "description": "Standard retail customer from low-risk jurisdiction"
+    },
+    "high_risk_jurisdiction": {
+        "name": "High-Risk Jurisdiction",
+        "jurisdiction_risk_multiplier": 2.0,  # Double risk
+        "occupation_risk_weight": 1.2,
+        "network_risk_weight": 1.5,
+        "aml_risk_bias": 0.3,
+        "description": "Customer from high-risk jurisdiction with sanctions exposure"
+    },
+    "pep_profile": {
+        "name": "Politically Exposed Profile",
+        "jurisdiction_risk_multiplier": 1.5,
+        "occupation_risk_weight": 2.0,  # Double weight
+        "network_risk_weight": 1.8,
+        "aml_risk_bias": 0.4,
+        "description": "Politically Exposed Person requiring enhanced due diligence"
+    },
+    "networked_entity": {
+        "name": "Networked Entity Exposure",
+        "jurisdiction_risk_multiplier": 1.3,
+        "occupation_risk_weight": 1.0,
+        "network_risk_weight": 3.0,  # Triple weight
+        "aml_risk_bias": 0.35,
+        "description": "Entity with complex relationship network and high-risk links"
+    }
+})
+
+
+_MARKET_SIGNAL_SCENARIOS = _read_only({
+    "calm_market": {
+        "name": "Calm Market",
+        "volatility_bias": -0.2,
+        "sentiment_bias": 0.1,
+        "liquidity_bias": 0.1,
+        "stress_threshold": 0.3,
+        "description": "Stable market conditions with low volatility"
+    },
+    "news_uncertainty": {
+        "name": "News-Driven Uncertainty",
+        "volatility_bias": 0.3,
+        "sentiment_bias": -0.4,
+        "liquidity_bias": 0.0,
+        "stress_threshold": 0.5,
+        "description": "Market uncertainty driven by news events and sentiment shifts"
+    },
+    "liquidity_stress": {
+        "name": "Liquidity Stress",
+        "volatility_bias": 0.4,
+        "sentiment_bias": -0.2,
+        "liquidity_bias": -0.5,  # Decrease liquidity
+        "stress_threshold": 0.7,
+        "description": "Market experiencing liquidity constraints and stress"
+    },
+    "macro_shock": {
+        "name": "Macro Shock Event",
+        "volatility_bias": 0.6,
+        "sentiment_bias": -0.6,
+        "liquidity_bias": -0.4,
+        "stress_threshold": 0.9,
+        "description": "Major macroeconomic shock affecting market stability"
+    }
+})
+
+
+_REGIME_SIMULATION_SCENARIOS = _read_only({
+    "volatility_expansion": {
+        "name": "Volatility Expansion",
+        "volatility_shock_level": 0.7,
+        "correlation_breakdown_score": 0.4,
+        "liquidity_crisis_level": 0.3,
+        "regime_transition_probability": 0.6,
+        "description": "Market experiencing expanding volatility regime"
+    },
+    "correlation_breakdown": {
+        "name": "Correlation Breakdown",
+        "volatility_shock_level": 0.5,
+        "correlation_breakdown_score": 0.8,  # High breakdown
+        "liquidity_crisis_level": 0.4,
+        "regime_transition_probability": 0.7,
+        "description": "Traditional asset correlations breaking down"
+    },
+    "liquidity_freeze": {
+        "name": "Liquidity Freeze",
+        "volatility_shock_level": 0.6,
+        "correlation_breakdown_score": 0.5,
+        "liquidity_crisis_level": 0.9,  # Very high
+        "regime_transition_probability": 0.8,
+        "description": "Severe liquidity crisis with market freeze conditions"
+    }
+})
+
+
 class FintechScenarioCatalog:
     """Scenario catalog for all Fintech modules"""
     
     @staticmethod
-    def get_credit_risk_scenario(scenario_name: str) -> Dict[str, Any]:
+    def get_credit_risk_scenario(scenario_name: str) -> Mapping[str, Any]:
         """Get credit risk scenario parameters"""
-        scenarios = {
-            "stable_economy": {
-                "name": "Stable Economy",
-                "macro_context": {
-                    "interest_rate_level": 2.5,
-                    "inflation_index": 0.2,
-                    "unemployment_index": 0.15,
-                    "economic_stress_level": 0.2
-                },
-                "default_probability_sensitivity": 1.0,  # Baseline
-                "confidence_degradation": 0.0,
-                "description": "Normal economic conditions with stable interest rates and low inflation"
-            },
-            "rising_interest_rates": {
-                "name": "Rising Interest Rates",
-                "macro_context": {
-                    "interest_rate_level": 5.5,
-                    "inflation_index": 0.4,
-                    "unemployment_index": 0.25,
-                    "economic_stress_level": 0.5
-                },
-                "default_probability_sensitivity": 1.4,  # 40% increase
-                "confidence_degradation": 0.1,
-                "description": "Rising interest rates increase borrowing costs and default risk"
-            },
-            "economic_downturn": {
-                "name": "Economic Downturn",
-                "macro_context": {
-                    "interest_rate_level": 1.5,
-                    "inflation_index": 0.3,
-                    "unemployment_index": 0.6,
-                    "economic_stress_level": 0.8
-                },
-                "default_probability_sensitivity": 2.0,  # 100% increase
-                "confidence_degradation": 0.2,
-                "description": "Economic recession with high unemployment and financial stress"
-            },
-            "high_inflation": {
-                "name": "High Inflation Environment",
-                "macro_context": {
-                    "interest_rate_level": 7.0,
-                    "inflation_index": 0.8,
-                    "unemployment_index": 0.35,
-                    "economic_stress_level": 0.6
-                },
-                "default_probability_sensitivity": 1.6,  # 60% increase
-                "confidence_degradation": 0.15,
-                "description": "High inflation erodes purchasing power and increases financial stress"
-            }
-        }
-        return scenarios.get(scenario_name, scenarios["stable_economy"])
+        return _CREDIT_RISK_SCENARIOS.get(scenario_name, _CREDIT_RISK_SCENARIOS["stable_economy"])
     
     @staticmethod
-    def get_fraud_detection_scenario(scenario_name: str) -> Dict[str, Any]:
+    def get_fraud_detection_scenario(scenario_name: str) -> Mapping[str, Any]:
         """Get fraud detection scenario parameters"""
-        scenarios = {
-            "normal_behavior": {
-                "name": "Normal Transaction Behavior",
-                "velocity_threshold_multiplier": 1.0,
-                "geo_deviation_weight": 1.0,
-                "device_trust_weight": 1.0,
-                "fraud_probability_bias": 0.0,
-                "description": "Standard transaction patterns with normal velocity and location"
-            },
-            "velocity_spike": {
-                "name": "Sudden Velocity Spike",
-                "velocity_threshold_multiplier": 0.5,  # Lower threshold
-                "geo_deviation_weight": 1.2,
-                "device_trust_weight": 1.1,
-                "fraud_probability_bias": 0.2,  # Increase fraud probability
-                "description": "Unusual transaction velocity indicating potential fraud"
-            },
-            "geo_shift": {
-                "name": "Geo-Location Shift",
-                "velocity_threshold_multiplier": 1.0,
-                "geo_deviation_weight": 2.0,  # Double weight on geo
-                "device_trust_weight": 1.5,
-                "fraud_probability_bias": 0.3,
-                "description": "Transaction from unusual geographic location"
-            },
-            "coordinated_fraud": {
-                "name": "Coordinated Fraud Pattern",
-                "velocity_threshold_multiplier": 0.3,
-                "geo_deviation_weight": 1.5,
-                "device_trust_weight": 2.0,
-                "fraud_probability_bias": 0.4,
-                "description": "Pattern suggesting coordinated fraud attack across multiple accounts"
-            }
-        }
-        return scenarios.get(scenario_name, scenarios["normal_behavior"])
+        return _FRAUD_DETECTION_SCENARIOS.get(scenario_name, _FRAUD_DETECTION_SCENARIOS["normal_behavior"])
     
     @staticmethod
-    def get_kyc_aml_scenario(scenario_name: str) -> Dict[str, Any]:
+    def get_kyc_aml_scenario(scenario_name: str) -> Mapping[str, Any]:
         """Get KYC/AML scenario parameters"""
-        scenarios = {
-            "low_risk_retail": {
-                "name": "Low-Risk Retail Customer",
-                "jurisdiction_risk_multiplier": 0.8,
-                "occupation_risk_weight": 0.5,
-                "network_risk_weight": 0.5,
-                "aml_risk_bias": -0.2,  # Decrease risk
-                "description": "Standard retail customer from low-risk jurisdiction"
-            },
-            "high_risk_jurisdiction": {
-                "name": "High-Risk Jurisdiction",
-                "jurisdiction_risk_multiplier": 2.0,  # Double risk
-                "occupation_risk_weight": 1.2,
-                "network_risk_weight": 1.5,
-                "aml_risk_bias": 0.3,
-                "description": "Customer from high-risk jurisdiction with sanctions exposure"
-            },
-            "pep_profile": {
-                "name": "Politically Exposed Profile",
-                "jurisdiction_risk_multiplier": 1.5,
-                "occupation_risk_weight": 2.0,  # Double weight
-                "network_risk_weight": 1.8,
-                "aml_risk_bias": 0.4,
-                "description": "Politically Exposed Person requiring enhanced due diligence"
-            },
-            "networked_entity": {
-                "name": "Networked Entity Exposure",
-                "jurisdiction_risk_multiplier": 1.3,
-                "occupation_risk_weight": 1.0,
-                "network_risk_weight": 3.0,  # Triple weight
-                "aml_risk_bias": 0.35,
-                "description": "Entity with complex relationship network and high-risk links"
-            }
-        }
-        return scenarios.get(scenario_name, scenarios["low_risk_retail"])
+        return _KYC_AML_SCENARIOS.get(scenario_name, _KYC_AML_SCENARIOS["low_risk_retail"])
     
     @staticmethod
-    def get_market_signal_scenario(scenario_name: str) -> Dict[str, Any]:
+    def get_market_signal_scenario(scenario_name: str) -> Mapping[str, Any]:
         """Get market signal scenario parameters"""
-        scenarios = {
-            "calm_market": {
-                "name": "Calm Market",
-                "volatility_bias": -0.2,
-                "sentiment_bias": 0.1,
-                "liquidity_bias": 0.1,
-                "stress_threshold": 0.3,
-                "description": "Stable market conditions with low volatility"
-            },
-            "news_uncertainty": {
-                "name": "News-Driven Uncertainty",
-                "volatility_bias": 0.3,
-                "sentiment_bias": -0.4,
-                "liquidity_bias": 0.0,
-                "stress_threshold": 0.5,
-                "description": "Market uncertainty driven by news events and sentiment shifts"
-            },
-            "liquidity_stress": {
-                "name": "Liquidity Stress",
-                "volatility_bias": 0.4,
-                "sentiment_bias": -0.2,
-                "liquidity_bias": -0.5,  # Decrease liquidity
-                "stress_threshold": 0.7,
-                "description": "Market experiencing liquidity constraints and stress"
-            },
-            "macro_shock": {
-                "name": "Macro Shock Event",
-                "volatility_bias": 0.6,
-                "sentiment_bias": -0.6,
-                "liquidity_bias": -0.4,
-                "stress_threshold": 0.9,
-                "description": "Major macroeconomic shock affecting market stability"
-            }
-        }
-        return scenarios.get(scenario_name, scenarios["calm_market"])
+        return _MARKET_SIGNAL_SCENARIOS.get(scenario_name, _MARKET_SIGNAL_SCENARIOS["calm_market"])
     
     @staticmethod
-    def get_regime_simulation_scenario(scenario_name: str) -> Dict[str, Any]:
+    def get_regime_simulation_scenario(scenario_name: str) -> Mapping[str, Any]:
         """Get regime simulation scenario parameters"""
-        scenarios = {
-            "volatility_expansion": {
-                "name": "Volatility Expansion",
-                "volatility_shock_level": 0.7,
-                "correlation_breakdown_score": 0.4,
-                "liquidity_crisis_level": 0.3,
-                "regime_transition_probability": 0.6,
-                "description": "Market experiencing expanding volatility regime"
-            },
-            "correlation_breakdown": {
-                "name": "Correlation Breakdown",
-                "volatility_shock_level": 0.5,
-                "correlation_breakdown_score": 0.8,  # High breakdown
-                "liquidity_crisis_level": 0.4,
-                "regime_transition_probability": 0.7,
-                "description": "Traditional asset correlations breaking down"
-            },
-            "liquidity_freeze": {
-                "name": "Liquidity Freeze",
-                "volatility_shock_level": 0.6,
-                "correlation_breakdown_score": 0.5,
-                "liquidity_crisis_level": 0.9,  # Very high
-                "regime_transition_probability": 0.8,
-                "description": "Severe liquidity crisis with market freeze conditions"
-            }
-        }
-        return scenarios.get(scenario_name, scenarios["volatility_expansion"])
+        return _REGIME_SIMULATION_SCENARIOS.get(scenario_name, _REGIME_SIMULATION_SCENARIOS["volatility_expansion"])
 
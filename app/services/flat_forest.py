@@ -0,0 +1,110 @@
+"""
+Flattened forest predictor
+Single-process numpy evaluation of fitted sklearn random forests, shared by
+the industry ML services for low-latency inference, plus the on-disk model
+bundles those services persist alongside it
+"""
+import os
+from typing import Any, Dict, Optional
+import joblib
+import numpy as np
+
+
+def save_model_bundle(path: str, bundle: Dict[str, Any]):
+    """
+    Persist a model bundle (model, scaler, FlatForest, ...) uncompressed
+    The bundle is written to a per-process temp file and renamed into place,
+    so a concurrent reader sees either the old file or the complete new one.
+    The temp file is removed if the dump fails.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        joblib.dump(bundle, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_model_bundle(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a bundle written by save_model_bundle, or None if there is none
+    Arrays are memory-mapped read-only, so processes loading the same file
+    share one page-cached copy of the node arrays.
+    """
+    if not os.path.exists(path):
+        return None
+    return joblib.load(path, mmap_mode="r")
+
+
+class FlatForest:
+    """
+    Fitted sklearn forest flattened into contiguous node arrays
+    All trees are walked in lockstep with a handful of vectorized numpy ops per
+    depth level, instead of one Python-level predict call per estimator
+    """
+    
+    def __init__(self, model):
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+        
+        feature = []
+        threshold = []
+        left = []
+        right = []
+        value = []
+        for offset, tree in zip(offsets, trees):
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+            # Leaves point back at themselves so extra depth steps are no-ops
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(np.where(is_leaf, np.inf, tree.threshold))
+            left.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+            leaf_value = tree.value[:, 0, :]
+            if hasattr(model, "classes_"):
+                # Per-tree class distributions, as DecisionTreeClassifier.predict_proba
+                normalizer = leaf_value.sum(axis=1, keepdims=True)
+                normalizer[normalizer == 0.0] = 1.0
+                leaf_value = leaf_value / normalizer
+            value.append(leaf_value)
+        
+        self.feature = np.concatenate(feature).astype(np.intp)
+        self.threshold = np.concatenate(threshold)
+        self.left = np.concatenate(left).astype(np.intp)
+        self.right = np.concatenate(right).astype(np.intp)
+        self.value = np.concatenate(value)
+        self.roots = offsets.astype(np.intp)
+        self.depth = max(tree.max_depth for tree in trees)
+        self.classes_ = getattr(model, "classes_", None)
+    
+    def _leaf_values(self, X: np.ndarray) -> np.ndarray:
+        """Leaf values reached by every row in every tree, shape (rows, trees, outputs)"""
+        # Trees split on float32 inputs, so compare exactly as sklearn does
+        X = np.asarray(X, dtype=np.float32)
+        if X.shape[0] == 1:
+            # Single-row requests: walk a flat node vector, no row fancy-indexing
+            x = X[0]
+            nodes = self.roots
+            for _ in range(self.depth):
+                go_left = x[self.feature[nodes]] <= self.threshold[nodes]
+                nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            return self.value[nodes][None]
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.roots.shape[0]))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes]
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Forest prediction, matching the wrapped estimator's predict"""
+        if self.classes_ is not None:
+            return self.classes_.take(self.predict_proba(X).argmax(axis=1))
+        return self._leaf_values(X).mean(axis=1)[:, 0]
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Mean class distribution across trees, matching predict_proba"""
+        return self._leaf_values(X).mean(axis=1)
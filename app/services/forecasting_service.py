@@ -1,14 +1,168 @@
 """
 Forecasting Service for time series prediction, demand forecasting, and ETA prediction
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
+from functools import lru_cache
+from types import MappingProxyType
+from collections import OrderedDict
+import threading
+import time
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
 import warnings
-warnings.filterwarnings('ignore')
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Forecast results kept per (series, horizon, method), least recently used evicted
+_FORECAST_CACHE_SIZE = 1024
+
+# ETA multiplier per carrier (placeholder); unknown carriers use 1.0
+_CARRIER_MULTIPLIERS = MappingProxyType({
+    "BlueDart": 1.0,
+    "Delhivery": 1.1,
+    "FedEx": 0.9,
+    "DHL": 0.95
+})
+
+
+def _to_datetime(dates: Any) -> Any:
+    """pd.to_datetime for the free-form date fallbacks, minus its format-inference warnings"""
+    # pandas is only needed for inputs the numpy fast path rejects
+    import pandas as pd
+    
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning)
+        return pd.to_datetime(dates)
+
+
+def _order_by_date(dates: List[Any], values: np.ndarray) -> np.ndarray:
+    """Reorder values by their dates"""
+    try:
+        parsed = np.array(dates, dtype='datetime64[ns]')
+    except (TypeError, ValueError):
+        # Date formats numpy cannot parse: let pandas handle them
+        parsed = _to_datetime(dates).values
+    # Series usually arrive in chronological order: one compare pass then
+    # skips the sort; otherwise a stable sort keeps same-date rows in input order
+    if np.all(parsed[1:] >= parsed[:-1]):
+        return values
+    return values[np.argsort(parsed, kind='stable')]
+
+
+def _sorted_values(historical_data: List[Dict[str, Any]]) -> np.ndarray:
+    """Series values ordered by date"""
+    try:
+        values = np.fromiter(
+            (point['value'] for point in historical_data), dtype=np.float64, count=len(historical_data)
+        )
+    except (KeyError, TypeError, ValueError):
+        # Missing or non-numeric values: let pandas handle them
+        import pandas as pd
+        
+        df = pd.DataFrame(historical_data)
+        df['date'] = _to_datetime(df['date'])
+        return df.sort_values('date')['value'].values
+    return _order_by_date([point['date'] for point in historical_data], values)
+
+
+def _smoothed_levels(deviations: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential smoothing levels along the last axis, for series given as deviations from their seed"""
+    # scipy.signal costs about a second to import; only load it once smoothing is used
+    from scipy.signal import lfilter
+    
+    return lfilter([alpha], [1.0, alpha - 1.0], deviations, axis=-1)
+
+
+def _moving_average_kernel(series: Union[np.ndarray, List[float]], n_history: int, window: int) -> None:
+    """
+    Fill series[n_history:] in place: each point is the mean of the `window`
+    points before it, earlier forecasts included
+    """
+    # Running sum over the trailing window: each step is one divide and an
+    # add/subtract, with no re-slicing or reallocation
+    total = 0.0
+    for i in range(n_history - window, n_history):
+        total += series[i]
+    for i in range(n_history, len(series)):
+        avg = total / window
+        series[i] = avg
+        total += avg - series[i - window]
+
+
+if NUMBA_AVAILABLE:
+    _moving_average_kernel = njit(cache=True)(_moving_average_kernel)
+
+
+def _moving_average_forecast(values: np.ndarray, horizon: int, window: int) -> np.ndarray:
+    """Recursive moving-average forecast of `horizon` points"""
+    n = len(values)
+    if NUMBA_AVAILABLE:
+        series = np.empty(n + horizon)
+        series[:n] = values
+        _moving_average_kernel(series, n, window)
+        # Copied out: results are cached, and must not keep the history alive
+        return series[n:].copy()
+    # Without numba the same loop runs over Python floats, which are much
+    # cheaper to index from the interpreter than numpy scalars
+    series = values.tolist() + [0.0] * horizon
+    _moving_average_kernel(series, n, window)
+    return np.array(series[n:], dtype=np.float64)
+
+
+@lru_cache(maxsize=4096)
+def _eta_core(carrier: str, weather_delay: bool, traffic_delay: bool, well_sampled: bool) -> Tuple[float, float]:
+    """(eta_hours, confidence) for a carrier and delay factors; pure, so memoized"""
+    # Base ETA (simplified - in production use route optimization)
+    base_hours = 24.0  # Default
+    
+    # Adjust based on carrier
+    multiplier = _CARRIER_MULTIPLIERS.get(carrier, 1.0)
+    
+    # Adjust based on factors
+    if weather_delay:
+        multiplier += 0.2
+    if traffic_delay:
+        multiplier += 0.15
+    
+    eta_hours = base_hours * multiplier
+    
+    # Calculate confidence based on historical data
+    confidence = 0.95 if well_sampled else 0.85
+    
+    return float(eta_hours), confidence
+
+
+class _EtaClock:
+    """
+    Coarse wall clock for ETA timestamps
+    Refreshes datetime.now() at most once a second and reuses each formatted
+    ETA until then; ETAs are hours out, so sub-second precision is not needed.
+    """
+    _TTL_NS = 1_000_000_000
+    
+    def __init__(self):
+        self._refresh(time.monotonic_ns())
+    
+    def _refresh(self, now_ns: int):
+        self._now = datetime.now()
+        self._formatted = {}
+        self._expires_ns = now_ns + self._TTL_NS
+    
+    def eta_iso(self, eta_hours: float) -> str:
+        now_ns = time.monotonic_ns()
+        if now_ns >= self._expires_ns:
+            self._refresh(now_ns)
+        formatted = self._formatted.get(eta_hours)
+        if formatted is None:
+            formatted = (self._now + timedelta(hours=eta_hours)).isoformat()
+            self._formatted[eta_hours] = formatted
+        return formatted
+
+
+_eta_clock = _EtaClock()
 
 
 class ForecastingService:
@@ -18,6 +172,11 @@ class ForecastingService:
         """Initialize forecasting models"""
         self.models = {}
         self.scalers = {}
+        self._forecast_cache = OrderedDict()
+        self._forecast_cache_lock = threading.Lock()
+        if NUMBA_AVAILABLE:
+            # Compile (or load from the on-disk cache) now, not on the first request
+            _moving_average_kernel(np.zeros(2), 1, 1)
     
     def forecast_time_series(
         self,
@@ -36,53 +195,77 @@ class ForecastingService:
         Returns:
             Forecast results with predictions and confidence intervals
         """
-        df = pd.DataFrame(historical_data)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
+        return self._forecast_from_arrays(_sorted_values(historical_data), forecast_horizon, method)
+    
+    def _forecast_from_arrays(self, values: np.ndarray, forecast_horizon: int, method: str) -> Dict[str, Any]:
+        """Forecast result for an already date-ordered series"""
+        if len(values) == 0:
+            return self._constant_forecast(0.0, forecast_horizon, method)
+        if np.ptp(values) == 0:
+            # Flat series: every method forecasts the level itself, with no spread
+            return self._constant_forecast(float(values[0]), forecast_horizon, method)
         
-        values = df['value'].values
+        # Callers such as predict_demand resend the same history per product;
+        # the key is the exact date-ordered values, so a hit is always valid
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        key = (values.tobytes(), forecast_horizon, method)
+        with self._forecast_cache_lock:
+            cached = self._forecast_cache.get(key)
+            if cached is not None:
+                self._forecast_cache.move_to_end(key)
+        if cached is None:
+            cached = self._forecast_arrays(values, forecast_horizon, method)
+            with self._forecast_cache_lock:
+                self._forecast_cache[key] = cached
+                if len(self._forecast_cache) > _FORECAST_CACHE_SIZE:
+                    self._forecast_cache.popitem(last=False)
+        forecast, confidence_intervals = cached
+        
+        return {
+            "forecast": forecast.tolist(),
+            "confidence_intervals": confidence_intervals.tolist(),
+            "method": method
+        }
+    
+    def _forecast_arrays(self, values: np.ndarray, forecast_horizon: int, method: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Forecast and (horizon, 2) confidence intervals for a non-empty date-ordered series"""
+        # Band spread from the observed history only, in one reduction up front
+        margin = 1.96 * values.std()
         
         if method == "moving_average":
             # Simple moving average
             window = min(7, len(values))
-            forecast = []
-            for i in range(forecast_horizon):
-                if len(values) >= window:
-                    avg = np.mean(values[-window:])
-                else:
-                    avg = np.mean(values) if len(values) > 0 else 0
-                forecast.append(avg)
-                values = np.append(values, avg)
+            forecast = _moving_average_forecast(values, forecast_horizon, window)
         
         elif method == "exponential_smoothing":
-            # Exponential smoothing
+            # Simple exponential smoothing: level_t = alpha * y_t + (1 - alpha) * level_{t-1},
+            # seeded with the first observation; every h-step forecast is the final level
             alpha = 0.3
-            forecast = []
-            last_value = values[-1] if len(values) > 0 else 0
-            for _ in range(forecast_horizon):
-                forecast.append(last_value)
+            # Filtered as deviations from the seed, so a flat series stays exactly flat
+            seed = float(values[0])
+            last_level = seed + _smoothed_levels(values - seed, alpha)[-1]
+            forecast = np.full(forecast_horizon, last_level)
         
         else:
             # Default: linear trend
-            if len(values) >= 2:
-                trend = (values[-1] - values[0]) / len(values)
-                last_value = values[-1]
-            else:
-                trend = 0
-                last_value = values[-1] if len(values) > 0 else 0
-            
-            forecast = [last_value + trend * (i + 1) for i in range(forecast_horizon)]
+            trend = (values[-1] - values[0]) / len(values) if len(values) >= 2 else 0.0
+            forecast = values[-1] + trend * np.arange(1, forecast_horizon + 1, dtype=np.float64)
         
         # Calculate confidence intervals (simplified)
-        std_dev = np.std(values) if len(values) > 0 else 0
-        confidence_intervals = [
-            [max(0, f - 1.96 * std_dev), f + 1.96 * std_dev]
-            for f in forecast
-        ]
+        confidence_intervals = np.stack(
+            (np.maximum(0.0, forecast - margin), forecast + margin), axis=1
+        )
         
+        # Cached and shared between calls; responses get fresh lists via tolist()
+        forecast.flags.writeable = False
+        confidence_intervals.flags.writeable = False
+        return forecast, confidence_intervals
+    
+    def _constant_forecast(self, level: float, forecast_horizon: int, method: str) -> Dict[str, Any]:
+        """Forecast result for a series with no variation (zero-width intervals)"""
         return {
-            "forecast": [float(f) for f in forecast],
-            "confidence_intervals": confidence_intervals,
+            "forecast": [level] * forecast_horizon,
+            "confidence_intervals": [[max(0.0, level), level] for _ in range(forecast_horizon)],
             "method": method
         }
     
@@ -107,35 +290,19 @@ class ForecastingService:
         Returns:
             ETA prediction with confidence
         """
-        # Base ETA (simplified - in production use route optimization)
-        base_hours = 24.0  # Default
-        
-        # Adjust based on carrier (placeholder)
-        carrier_multipliers = {
-            "BlueDart": 1.0,
-            "Delhivery": 1.1,
-            "FedEx": 0.9,
-            "DHL": 0.95
-        }
-        multiplier = carrier_multipliers.get(carrier, 1.0)
-        
-        # Adjust based on factors
-        if factors:
-            if factors.get("weather_delay"):
-                multiplier += 0.2
-            if factors.get("traffic_delay"):
-                multiplier += 0.15
-        
-        eta_hours = base_hours * multiplier
-        
-        # Calculate confidence based on historical data
-        confidence = 0.85
-        if historical_etas and len(historical_etas) > 10:
-            confidence = 0.95
+        # Only the carrier, the two delay flags and whether there is enough
+        # history feed the estimate; the timestamp stays outside the cache
+        factors = factors or {}
+        eta_hours, confidence = _eta_core(
+            carrier,
+            bool(factors.get("weather_delay")),
+            bool(factors.get("traffic_delay")),
+            bool(historical_etas) and len(historical_etas) > 10
+        )
         
         return {
-            "eta_hours": float(eta_hours),
-            "eta_date": (datetime.now() + timedelta(hours=eta_hours)).isoformat(),
+            "eta_hours": eta_hours,
+            "eta_date": _eta_clock.eta_iso(eta_hours),
             "confidence": confidence,
             "factors": [
                 "Base delivery time",
@@ -169,22 +336,72 @@ class ForecastingService:
                 "confidence_intervals": [[0, 0]] * forecast_days
             }
         
-        df = pd.DataFrame(historical_sales)
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.sort_values('date')
-        
-        # Use forecasting method
-        result = self.forecast_time_series(
-            historical_data=[
-                {"date": row.get('date', datetime.now()), "value": row.get('quantity', 0)}
-                for row in historical_sales
-            ],
-            forecast_horizon=forecast_days,
-            method="exponential_smoothing"
+        # Read quantities and dates straight from the sales rows, without an
+        # intermediate {date, value} list; undated rows count as today
+        quantities = np.fromiter(
+            (row.get('quantity', 0) for row in historical_sales), dtype=np.float64, count=len(historical_sales)
         )
+        now = datetime.now()
+        values = _order_by_date([row.get('date', now) for row in historical_sales], quantities)
         
-        return result
+        return self._forecast_from_arrays(values, forecast_days, "exponential_smoothing")
+    
+    def predict_demand_batch(
+        self,
+        product_ids: List[str],
+        sales: np.ndarray,
+        forecast_days: int = 30,
+        method: str = "exponential_smoothing"
+    ) -> np.ndarray:
+        """
+        Predict demand for many products at once
+        
+        Args:
+            product_ids: Product identifiers, one per row of `sales`
+            sales: (products, periods) date-ordered sales quantities
+            forecast_days: Number of days to forecast
+            method: Forecasting method, as in forecast_time_series
+            
+        Returns:
+            (products, forecast_days) demand forecast; row i matches the
+            single-product forecast for product_ids[i]
+        """
+        sales = np.asarray(sales, dtype=np.float64)
+        if sales.ndim != 2 or sales.shape[0] != len(product_ids):
+            raise ValueError("sales must have shape (len(product_ids), periods)")
+        n_products, n_periods = sales.shape
+        if n_periods == 0:
+            return np.zeros((n_products, forecast_days))
+        
+        if method == "moving_average":
+            # Same recurrence as _moving_average_kernel, one column step per
+            # forecast day for all products together
+            window = min(7, n_periods)
+            series = np.empty((n_products, n_periods + forecast_days))
+            series[:, :n_periods] = sales
+            total = sales[:, n_periods - window:].sum(axis=1)
+            for i in range(n_periods, n_periods + forecast_days):
+                avg = total / window
+                series[:, i] = avg
+                total += avg - series[:, i - window]
+            return series[:, n_periods:]
+        
+        elif method == "exponential_smoothing":
+            # Every product's SES recurrence in one filter pass along time
+            alpha = 0.3
+            seed = sales[:, :1]
+            levels = _smoothed_levels(sales - seed, alpha)
+            last_level = seed[:, 0] + levels[:, -1]
+            return np.repeat(last_level[:, None], forecast_days, axis=1)
+        
+        else:
+            # Default: linear trend
+            if n_periods >= 2:
+                trend = (sales[:, -1] - sales[:, 0]) / n_periods
+            else:
+                trend = np.zeros(n_products)
+            steps = np.arange(1, forecast_days + 1, dtype=np.float64)
+            return sales[:, -1:] + trend[:, None] * steps
 
 
 forecasting_service = ForecastingService()
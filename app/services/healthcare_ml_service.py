@@ -2,13 +2,37 @@
 Healthcare-specific ML Service
 Real ML models for risk scoring, analysis, and predictions
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import numpy as np
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
-import pickle
 import os
 from app.core.config import settings
+from app.services.flat_forest import FlatForest, load_model_bundle, save_model_bundle
+
+
+# Risk model inputs, in feature-vector order
+_FEATURE_NAMES = (
+    "BP Systolic", "BP Diastolic", "Heart Rate", "Temperature",
+    "History Count", "Medication Count", "Abnormal Labs"
+)
+
+# Persisted risk model bundle; bump the suffix when the bundle layout or the
+# default training recipe changes so stale files are retrained
+_RISK_MODEL_FILE = "healthcare_risk_model_v2.joblib"
+
+# Distinct feature vectors whose risk score is kept per model
+_RISK_SCORE_CACHE_SIZE = 4096
+
+# Normal (low, high) range per lab test; a value outside it counts as an
+# abnormal lab for risk scoring
+_LAB_NORMAL_RANGES = {
+    "glucose": (70, 100),
+    "cholesterol": (-np.inf, 200),
+    "hemoglobin": (12, 16),
+    "creatinine": (-np.inf, 1.2)
+}
 
 
 class HealthcareMLService:
@@ -20,21 +44,45 @@ class HealthcareMLService:
         os.makedirs(self.models_dir, exist_ok=True)
         self.scaler = None
         self.risk_model = None
+        # Flattened copy of risk_model for single-row scoring
+        self.risk_predictor = None
+        # Scaler mean and 1 / scale_, so standardizing skips sklearn's
+        # per-call validation
+        self._scaler_mean = None
+        self._scaler_inv_scale = None
+        # Derived from risk_model.feature_importances_ when the model is set
+        # (the property averages over all trees): top factors as
+        # (index, name, importance) and the full name -> importance map
+        self._top_factors = []
+        self._feature_importance = {}
+        # Memoized _score_features for the current model; dashboards resubmit
+        # the same vitals bundle on refresh
+        self._cached_score_features = None
         self._initialize_models()
     
     def _initialize_models(self):
         """Initialize or load trained models"""
-        # Try to load pre-trained model, otherwise use default
-        model_path = os.path.join(self.models_dir, "healthcare_risk_model.pkl")
-        if os.path.exists(model_path):
-            try:
-                with open(model_path, 'rb') as f:
-                    self.risk_model = pickle.load(f)
-            except Exception as e:
-                print(f"Error loading model: {e}, using default model")
-                self._create_default_model()
-        else:
+        # Load the persisted model bundle, otherwise train and save the default
+        if not self._load_model():
             self._create_default_model()
+            # sklearn's predict dispatches per-tree jobs (n_jobs=-1), which
+            # dominates a single-patient request; walk all trees in numpy instead
+            self.risk_predictor = FlatForest(self.risk_model)
+            self._save_model()
+        if self.scaler is not None:
+            self._scaler_mean = self.scaler.mean_
+            self._scaler_inv_scale = 1.0 / self.scaler.scale_
+        feature_importance = self.risk_model.feature_importances_
+        self._top_factors = [
+            (int(idx), _FEATURE_NAMES[idx], float(feature_importance[idx]))
+            for idx in np.argsort(feature_importance)[::-1][:3]
+            if feature_importance[idx] > 0.1
+        ]
+        self._feature_importance = {
+            name: float(imp) for name, imp in zip(_FEATURE_NAMES, feature_importance)
+        }
+        # Rebuilt with the model, so a retrained model never serves stale scores
+        self._cached_score_features = lru_cache(maxsize=_RISK_SCORE_CACHE_SIZE)(self._score_features)
     
     def _create_default_model(self):
         """Create a default trained model for risk scoring"""
@@ -80,11 +128,30 @@ class HealthcareMLService:
             n_jobs=-1
         )
         self.risk_model.fit(X_train_scaled, y_train)
-        
-        # Save model
+    
+    def _load_model(self) -> bool:
+        """Load the persisted risk model bundle; returns False when it must be trained"""
         try:
-            with open(os.path.join(self.models_dir, "healthcare_risk_model.pkl"), 'wb') as f:
-                pickle.dump(self.risk_model, f)
+            bundle = load_model_bundle(os.path.join(self.models_dir, _RISK_MODEL_FILE))
+        except Exception as e:
+            print(f"Error loading model: {e}, using default model")
+            return False
+        if bundle is None:
+            return False
+        self.risk_model = bundle["model"]
+        self.scaler = bundle["scaler"]
+        self.risk_predictor = bundle["predictor"]
+        return True
+    
+    def _save_model(self):
+        """Persist the risk model with its scaler and flattened predictor"""
+        bundle = {
+            "model": self.risk_model,
+            "scaler": self.scaler,
+            "predictor": self.risk_predictor
+        }
+        try:
+            save_model_bundle(os.path.join(self.models_dir, _RISK_MODEL_FILE), bundle)
         except Exception as e:
             print(f"Could not save model: {e}")
     
@@ -132,21 +199,15 @@ class HealthcareMLService:
         # Count abnormal lab results
         lab_abnormal_count = 0
         for lab in lab_results or []:
-            value = lab.get("value", 0)
-            test = lab.get("test", "").lower()
-            
-            # Check against normal ranges
-            if test == "glucose" and (value < 70 or value > 100):
-                lab_abnormal_count += 1
-            elif test == "cholesterol" and value > 200:
-                lab_abnormal_count += 1
-            elif test == "hemoglobin" and (value < 12 or value > 16):
-                lab_abnormal_count += 1
-            elif test == "creatinine" and value > 1.2:
-                lab_abnormal_count += 1
+            # Check against normal ranges (one lookup per lab; untracked tests are skipped)
+            normal_range = _LAB_NORMAL_RANGES.get(lab.get("test", "").lower())
+            if normal_range is not None:
+                value = lab.get("value", 0)
+                if value < normal_range[0] or value > normal_range[1]:
+                    lab_abnormal_count += 1
         
-        # Prepare feature vector
-        features = np.array([[
+        # Predict risk score using ML model (memoized per feature vector)
+        risk_score, features = self._cached_score_features((
             bp_systolic,
             bp_diastolic,
             heart_rate,
@@ -154,38 +215,18 @@ class HealthcareMLService:
             history_count,
             medication_count,
             lab_abnormal_count
-        ]])
-        
-        # Scale features (scaler is fitted during model initialization)
-        if self.scaler is None:
-            # Fallback: use raw features if scaler not initialized
-            features_scaled = features
-        else:
-            features_scaled = self.scaler.transform(features)
-        
-        # Predict risk score using ML model
-        risk_score = float(self.risk_model.predict(features_scaled)[0])
-        risk_score = np.clip(risk_score, 0.0, 1.0)
+        ))
         
-        # Get feature importance for explanation
-        feature_importance = self.risk_model.feature_importances_
-        feature_names = [
-            "BP Systolic", "BP Diastolic", "Heart Rate", "Temperature",
-            "History Count", "Medication Count", "Abnormal Labs"
+        # Identify top contributing factors (ranked once at model load)
+        top_factors = [
+            {
+                "factor": factor_name,
+                "value": float(features[idx]),
+                "importance": importance
+            }
+            for idx, factor_name, importance in self._top_factors
         ]
         
-        # Identify top contributing factors
-        top_factors = []
-        for idx in np.argsort(feature_importance)[::-1][:3]:
-            if feature_importance[idx] > 0.1:
-                factor_name = feature_names[idx]
-                factor_value = features[0][idx]
-                top_factors.append({
-                    "factor": factor_name,
-                    "value": float(factor_value),
-                    "importance": float(feature_importance[idx])
-                })
-        
         # Determine risk level
         if risk_score >= 0.6:
             risk_level = "high"
@@ -209,11 +250,28 @@ class HealthcareMLService:
             "confidence": confidence,
             "top_contributing_factors": top_factors,
             "model_used": "RandomForestRegressor",
-            "feature_importance": {
-                name: float(imp) for name, imp in zip(feature_names, feature_importance)
-            }
+            "feature_importance": dict(self._feature_importance)
         }
     
+    def _score_features(self, feature_values: Tuple[Any, ...]) -> Tuple[float, np.ndarray]:
+        """Clipped model risk score and the (read-only) feature vector for one patient"""
+        features = np.array([feature_values])
+        
+        # Scale features (scaler is fitted during model initialization)
+        if self._scaler_mean is None:
+            # Fallback: use raw features if scaler not initialized
+            features_scaled = features
+        else:
+            features_scaled = (features - self._scaler_mean) * self._scaler_inv_scale
+        
+        risk_score = float(self.risk_predictor.predict(features_scaled)[0])
+        risk_score = np.clip(risk_score, 0.0, 1.0)
+        
+        # Shared by every cache hit, so callers must not be able to modify it
+        features = features[0]
+        features.flags.writeable = False
+        return risk_score, features
+    
     def generate_insights(
         self,
         vitals: Dict[str, Any],
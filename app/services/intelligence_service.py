@@ -2,14 +2,72 @@
 Intelligence Content Service
 Service layer for retrieving and managing intelligence content from the central store
 """
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Hashable
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, case
 from app.models.intelligence import (
     IntelligenceContent, IntelligenceConversation, WorkflowComparison, 
     ModelHonestyMetadata, ContentCategory, ConfidenceLevel
 )
-from sqlalchemy import cast, String
+
+
+_CONTENT_CACHE_SIZE = 2048
+_CONTENT_CACHE_TTL_S = 60.0
+
+
+class _ContentCache:
+    """
+    Per-process TTL cache of content reads, keyed by the lookup arguments
+    Content is admin-curated and changes rarely, so repeated lookups are
+    answered from here for up to a minute instead of going to the DB. Only
+    found rows are cached: a miss goes back to the DB on the next lookup,
+    so newly seeded content shows up immediately.
+    """
+    
+    def __init__(self, maxsize: int, ttl_s: float):
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Any:
+        """Cached value for key, or None if absent or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if now >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_s, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_content_cache = _ContentCache(_CONTENT_CACHE_SIZE, _CONTENT_CACHE_TTL_S)
+
+
+def clear_content_cache():
+    """
+    Drop this process's cached content reads, e.g. after editing the content
+    store; other worker processes keep theirs until the TTL expires
+    """
+    _content_cache.clear()
 
 
 class IntelligenceService:
@@ -18,6 +76,16 @@ class IntelligenceService:
     def __init__(self, db: Session):
         self.db = db
     
+    def _cache_rows(self, key: Hashable, rows: Any) -> Any:
+        """Detach found rows (a row or a tuple of rows) from this session and cache them"""
+        if not rows:
+            # Misses (None or no rows) are not cached
+            return rows
+        for row in rows if isinstance(rows, tuple) else (rows,):
+            self.db.expunge(row)
+        _content_cache.put(key, rows)
+        return rows
+    
     def get_content(
         self,
         content_key: Optional[str] = None,
@@ -31,6 +99,11 @@ class IntelligenceService:
         """
         Retrieve intelligence content by key or context
         """
+        key = ("content", content_key, category, industry_id, use_case_id, confidence_level, audience_level)
+        content = _content_cache.get(key)
+        if content is not None:
+            return content
+        
         query = self.db.query(IntelligenceContent).filter(
             IntelligenceContent.is_active == True,
             IntelligenceContent.is_deprecated == False
@@ -40,10 +113,9 @@ class IntelligenceService:
             query = query.filter(IntelligenceContent.content_key == content_key)
         
         if category:
-            # Use enum value (string) for SQLAlchemy comparison
-            # SQLAlchemy Enum columns need the string value, not the enum object
-            category_value = category.value if hasattr(category, 'value') else str(category)
-            query = query.filter(cast(IntelligenceContent.category, String) == category_value)
+            # Compared on the enum column itself (bound by value), so the
+            # category indexes stay usable
+            query = query.filter(IntelligenceContent.category == category)
         
         if industry_id:
             query = query.filter(
@@ -75,7 +147,7 @@ class IntelligenceService:
             IntelligenceContent.created_at.desc()
         )
         
-        return query.first()
+        return self._cache_rows(key, query.first())
     
     def get_multiple_content(
         self,
@@ -87,16 +159,20 @@ class IntelligenceService:
         """
         Retrieve multiple intelligence content items
         """
+        key = ("content_list", category, industry_id, use_case_id, limit)
+        content_list = _content_cache.get(key)
+        if content_list is not None:
+            return list(content_list)
+        
         query = self.db.query(IntelligenceContent).filter(
             IntelligenceContent.is_active == True,
             IntelligenceContent.is_deprecated == False
         )
         
         if category:
-            # Use enum value (string) for SQLAlchemy comparison
-            # SQLAlchemy Enum columns need the string value, not the enum object
-            category_value = category.value if hasattr(category, 'value') else str(category)
-            query = query.filter(cast(IntelligenceContent.category, String) == category_value)
+            # Compared on the enum column itself (bound by value), so the
+            # category indexes stay usable
+            query = query.filter(IntelligenceContent.category == category)
         
         if industry_id:
             query = query.filter(
@@ -119,7 +195,7 @@ class IntelligenceService:
             IntelligenceContent.created_at.desc()
         ).limit(limit)
         
-        return query.all()
+        return list(self._cache_rows(key, tuple(query.all())))
     
     def get_explanation(
         self,
@@ -143,25 +219,51 @@ class IntelligenceService:
             else:
                 confidence_level = ConfidenceLevel.UNCERTAIN
         
-        # Try to find specific explanation first
+        key = ("explanation", context, industry_id, use_case_id, confidence_level)
+        content = _content_cache.get(key)
+        if content is not None:
+            return content
+        
+        # Specific explanation first, falling back to the generic one. Both
+        # candidates come from a single query: rows matching the specific key
+        # rank ahead of the rest, then the usual specificity ordering applies
         content_key = f"{industry_id or 'global'}.{use_case_id or 'general'}.decision_explanation.{context}"
-        content = self.get_content(
-            content_key=content_key,
-            category=ContentCategory.DECISION_EXPLANATION,
-            industry_id=industry_id,
-            use_case_id=use_case_id,
-            confidence_level=confidence_level
+        query = self.db.query(IntelligenceContent).filter(
+            IntelligenceContent.is_active == True,
+            IntelligenceContent.is_deprecated == False,
+            IntelligenceContent.category == ContentCategory.DECISION_EXPLANATION
         )
         
-        # Fallback to generic explanation
-        if not content:
-            content = self.get_content(
-                category=ContentCategory.DECISION_EXPLANATION,
-                industry_id=industry_id,
-                confidence_level=confidence_level
+        if industry_id:
+            query = query.filter(
+                or_(
+                    IntelligenceContent.industry_id == industry_id,
+                    IntelligenceContent.industry_id.is_(None)
+                )
+            )
+        
+        if confidence_level:
+            query = query.filter(IntelligenceContent.confidence_level == confidence_level)
+        
+        specific = IntelligenceContent.content_key == content_key
+        if use_case_id:
+            specific = and_(
+                specific,
+                or_(
+                    IntelligenceContent.use_case_id == use_case_id,
+                    IntelligenceContent.use_case_id.is_(None)
+                )
             )
         
-        return content
+        query = query.order_by(
+            case((specific, 0), else_=1),
+            IntelligenceContent.use_case_id.isnot(None).desc(),
+            IntelligenceContent.industry_id.isnot(None).desc(),
+            IntelligenceContent.display_priority.desc(),
+            IntelligenceContent.created_at.desc()
+        )
+        
+        return self._cache_rows(key, query.first())
     
     def get_workflow_comparison(
         self,
@@ -171,6 +273,11 @@ class IntelligenceService:
         """
         Get conventional vs AI workflow comparison
         """
+        key = ("workflow_comparison", industry_id, use_case_id)
+        comparison = _content_cache.get(key)
+        if comparison is not None:
+            return comparison
+        
         query = self.db.query(WorkflowComparison).filter(
             WorkflowComparison.is_active == True,
             WorkflowComparison.industry_id == industry_id
@@ -179,7 +286,7 @@ class IntelligenceService:
         if use_case_id:
             query = query.filter(WorkflowComparison.use_case_id == use_case_id)
         
-        return query.order_by(WorkflowComparison.created_at.desc()).first()
+        return self._cache_rows(key, query.order_by(WorkflowComparison.created_at.desc()).first())
     
     def get_model_honesty_metadata(
         self,
@@ -190,6 +297,11 @@ class IntelligenceService:
         """
         Get model honesty and trust metadata
         """
+        key = ("model_honesty", model_name, use_case_id, industry_id)
+        metadata = _content_cache.get(key)
+        if metadata is not None:
+            return metadata
+        
         query = self.db.query(ModelHonestyMetadata).filter(
             ModelHonestyMetadata.is_active == True,
             ModelHonestyMetadata.model_name == model_name
@@ -201,7 +313,7 @@ class IntelligenceService:
         if industry_id:
             query = query.filter(ModelHonestyMetadata.industry_id == industry_id)
         
-        return query.order_by(ModelHonestyMetadata.created_at.desc()).first()
+        return self._cache_rows(key, query.order_by(ModelHonestyMetadata.created_at.desc()).first())
     
     def save_conversation(
         self,
@@ -234,9 +346,13 @@ class IntelligenceService:
             depth_level=depth_level
         )
         
+        # The INSERT returns id and created_at (eager_defaults), so there is no
+        # refresh SELECT; detaching before commit keeps them loaded instead of
+        # expiring the row
         self.db.add(conversation)
+        self.db.flush()
+        self.db.expunge(conversation)
         self.db.commit()
-        self.db.refresh(conversation)
         
         return conversation
     